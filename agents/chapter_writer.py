@@ -93,9 +93,8 @@ async def execute_chapter_writer(
         }
 
     # Format scenes for the prompt
-    scenes_text = ""
-    for scene in chapter_data.get("scenes", []):
-        scenes_text += f"""
+    scenes_text = "".join(
+        f"""
 ### Scene {scene.get('scene_number', '?')}
 - **Question**: {scene.get('scene_question', 'N/A')}
 - **Characters**: {', '.join(scene.get('characters', []))}
@@ -104,22 +103,8 @@ async def execute_chapter_writer(
 - **Outcome**: {scene.get('outcome', 'N/A')}
 - **Word Target**: {scene.get('word_target', 1500)} words
 """
-
-    # Get character info for the POV character
-    character_arch = context.inputs.get("character_architecture", {})
-    protagonist = character_arch.get("protagonist_profile", {})
-    supporting = character_arch.get("supporting_cast", [])
-
-    character_reference = f"""
-**Protagonist**: {protagonist.get('name', 'Protagonist')}
-- Traits: {', '.join(protagonist.get('traits', []))}
-- Wound: {protagonist.get('backstory_wound', 'N/A')}
-- Want vs Need: {context.inputs.get('character_architecture', {}).get('want_vs_need', {})}
-
-**Supporting Cast**:
-"""
-    for char in supporting[:3]:  # Limit to avoid token overflow
-        character_reference += f"- {char.get('name', '?')}: {char.get('function', 'N/A')}\n"
+        for scene in chapter_data.get("scenes", [])
+    )
 
     # Get previous chapter summary if available
     previous_summary = "This is the first chapter."
@@ -132,12 +117,7 @@ async def execute_chapter_writer(
                 previous_summary = prev_ch.get("summary", "Previous chapter completed.")
                 break
 
-    # Get thematic focus
-    thematic = context.inputs.get("thematic_architecture", {})
-    thematic_focus = f"""
-- Primary Theme: {thematic.get('primary_theme', {}).get('statement', 'N/A')}
-- Thematic Question: {thematic.get('thematic_question', 'N/A')}
-"""
+    book = _book_sections(context)
 
     # Adjust word target for quick mode
     word_target = 500 if quick_mode else chapter_data.get("word_target", 3000)
@@ -146,17 +126,17 @@ async def execute_chapter_writer(
     prompt = CHAPTER_WRITING_PROMPT.format(
         chapter_number=chapter_number,
         chapter_title=chapter_data.get("title", f"Chapter {chapter_number}"),
-        voice_specification=_format_voice_spec(context.inputs.get("voice_specification", {})),
+        voice_specification=book["voice_specification"],
         chapter_goal=chapter_data.get("chapter_goal", "Advance the story"),
         pov=chapter_data.get("pov", "Protagonist"),
         opening_hook=chapter_data.get("opening_hook", ""),
         closing_hook=chapter_data.get("closing_hook", ""),
         word_target=word_target,
         scenes=scenes_text,
-        character_reference=character_reference,
-        world_rules=_format_world_rules(context.inputs.get("world_rules", {})),
+        character_reference=book["character_reference"],
+        world_rules=book["world_rules"],
         previous_summary=previous_summary,
-        thematic_focus=thematic_focus
+        thematic_focus=book["thematic_focus"]
     )
 
     # Add quick mode instruction
@@ -217,6 +197,51 @@ Summary:"""
         }
 
 
+def _book_sections(context: ExecutionContext) -> Dict[str, str]:
+    """
+    Prompt sections that are the same for every chapter of the book.
+
+    Built once per context and kept in context.memo, so batch writers that
+    reuse one context across chapters don't re-format them each time.
+    """
+    sections = context.memo.get("chapter_writer_sections")
+    if sections is not None:
+        return sections
+
+    # Get character info for the POV character
+    character_arch = context.inputs.get("character_architecture", {})
+    protagonist = character_arch.get("protagonist_profile", {})
+    supporting = character_arch.get("supporting_cast", [])
+
+    character_reference = f"""
+**Protagonist**: {protagonist.get('name', 'Protagonist')}
+- Traits: {', '.join(protagonist.get('traits', []))}
+- Wound: {protagonist.get('backstory_wound', 'N/A')}
+- Want vs Need: {character_arch.get('want_vs_need', {})}
+
+**Supporting Cast**:
+""" + "".join(
+        f"- {char.get('name', '?')}: {char.get('function', 'N/A')}\n"
+        for char in supporting[:3]  # Limit to avoid token overflow
+    )
+
+    # Get thematic focus
+    thematic = context.inputs.get("thematic_architecture", {})
+    thematic_focus = f"""
+- Primary Theme: {thematic.get('primary_theme', {}).get('statement', 'N/A')}
+- Thematic Question: {thematic.get('thematic_question', 'N/A')}
+"""
+
+    sections = {
+        "voice_specification": _format_voice_spec(context.inputs.get("voice_specification", {})),
+        "character_reference": character_reference,
+        "world_rules": _format_world_rules(context.inputs.get("world_rules", {})),
+        "thematic_focus": thematic_focus,
+    }
+    context.memo["chapter_writer_sections"] = sections
+    return sections
+
+
 def _format_voice_spec(voice_spec: Dict[str, Any]) -> str:
     """Format voice specification for the prompt."""
     if not voice_spec:
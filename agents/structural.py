@@ -12,7 +12,7 @@ These agents design and execute the story structure:
 import asyncio
 import logging
 import os
-from typing import Callable, Dict, Any, List, Optional
+from typing import Awaitable, Callable, Dict, Any, List, Optional
 from core.orchestrator import ExecutionContext
 
 logger = logging.getLogger(__name__)
@@ -587,6 +587,44 @@ async def execute_voice_specification(context: ExecutionContext) -> Dict[str, An
         }
 
 
+async def _gather_or_cancel(*aws: Awaitable[Any]) -> List[Any]:
+    # asyncio.gather leaves the other awaitables running when one raises;
+    # cancel them so a timed-out chapter doesn't leave LLM calls in flight.
+    tasks = [asyncio.ensure_future(a) for a in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for t in tasks:
+            t.cancel()
+        raise
+
+
+async def _report_progress(
+    progress_callback: Optional[Callable[[dict], Any]],
+    chapter_num: int,
+    status: str,
+    word_count: int,
+    chapters_done: int,
+    chapters_total: int,
+) -> None:
+    # Sent as soon as each chapter settles; a failing callback (sync or async)
+    # must never abort generation.
+    if progress_callback is None:
+        return
+    try:
+        cb = progress_callback({
+            "chapter": chapter_num,
+            "status": status,
+            "word_count": word_count,
+            "chapters_done": chapters_done,
+            "chapters_total": chapters_total,
+        })
+        if asyncio.iscoroutine(cb):
+            await cb
+    except Exception:
+        logger.debug("draft_generation: progress_callback raised for chapter %s", chapter_num, exc_info=True)
+
+
 async def execute_draft_generation(
     context: ExecutionContext,
     progress_callback: Optional[Callable[[dict], Any]] = None,
@@ -606,6 +644,11 @@ async def execute_draft_generation(
     outline = chapter_blueprint.get("chapter_outline", [])
     chapters_total = len(outline)
 
+    # Book-level prompt inputs don't change between chapters; look them up once.
+    voice_specification = context.inputs.get("voice_specification", {})
+    character_architecture = context.inputs.get("character_architecture", {})
+    world_rules = context.inputs.get("world_rules", {})
+
     for chapter_index, chapter in enumerate(outline):
         chapter_num = chapter.get("number", 0)
         chapter_title = chapter.get("title", f"Chapter {chapter_num}")
@@ -619,20 +662,17 @@ async def execute_draft_generation(
             prompt = DRAFT_GENERATION_PROMPT.format(
                 chapter_number=chapter_num,
                 chapter_title=chapter_title,
-                voice_specification=context.inputs.get("voice_specification", {}),
+                voice_specification=voice_specification,
                 chapter_blueprint=chapter,
-                character_architecture=context.inputs.get("character_architecture", {}),
-                world_rules=context.inputs.get("world_rules", {}),
+                character_architecture=character_architecture,
+                world_rules=world_rules,
                 previous_summary=previous_summary
             )
 
             timeout = _DRAFT_CHAPTER_TIMEOUT
             try:
-                chapter_text = await asyncio.wait_for(llm.generate(prompt), timeout=timeout)
-                summary = await asyncio.wait_for(
-                    llm.generate(f"Summarize this chapter in 2 sentences:\n{chapter_text[:2000]}"),
-                    timeout=timeout,
-                )
+                async with asyncio.timeout(timeout):
+                    chapter_text = await llm.generate(prompt)
 
                 # Evaluate outline adherence (structured) for this chapter
                 adherence_prompt = f"""You are verifying whether a generated chapter follows its blueprint.
@@ -658,10 +698,15 @@ Rules:
 - outline_adherence_score is 0-100.
 - scene_checks must include every scene_number listed in the blueprint.
 - If deviation=true, suggested_fix must be specific."""
-                adherence = await asyncio.wait_for(
-                    llm.generate(adherence_prompt, response_format="json", temperature=0.2, max_tokens=1600),
-                    timeout=timeout,
-                )
+                # The summary (which the next chapter's prompt needs) and the
+                # adherence check both depend only on this chapter's text, so
+                # they run concurrently under one timeout; chapters themselves
+                # stay sequential.
+                async with asyncio.timeout(timeout):
+                    summary, adherence = await _gather_or_cancel(
+                        llm.generate(f"Summarize this chapter in 2 sentences:\n{chapter_text[:2000]}"),
+                        llm.generate(adherence_prompt, response_format="json", temperature=0.2, max_tokens=1600),
+                    )
 
                 score = adherence.get("outline_adherence_score")
                 if isinstance(score, int):
@@ -683,37 +728,17 @@ Rules:
                     "word_count": word_count,
                 })
 
-                if progress_callback is not None:
-                    try:
-                        cb = progress_callback({
-                            "chapter": chapter_num,
-                            "status": "ok",
-                            "word_count": word_count,
-                            "chapters_done": chapter_index + 1,
-                            "chapters_total": chapters_total,
-                        })
-                        if asyncio.iscoroutine(cb):
-                            await cb
-                    except Exception:
-                        logger.debug("draft_generation: progress_callback raised for chapter %s", chapter_num, exc_info=True)
-
-            except asyncio.TimeoutError:
+                await _report_progress(
+                    progress_callback, chapter_num, "ok", word_count, chapter_index + 1, chapters_total
+                )
+
+            except TimeoutError:
                 err_msg = f"LLM timeout after {timeout}s"
                 logger.error("draft_generation: Chapter %s timed out (%s)", chapter_num, err_msg)
                 failed_chapters.append({"chapter": chapter_num, "error": err_msg})
-                if progress_callback is not None:
-                    try:
-                        cb = progress_callback({
-                            "chapter": chapter_num,
-                            "status": "failed",
-                            "word_count": 0,
-                            "chapters_done": chapter_index + 1,
-                            "chapters_total": chapters_total,
-                        })
-                        if asyncio.iscoroutine(cb):
-                            await cb
-                    except Exception:
-                        logger.debug("draft_generation: progress_callback raised for chapter %s", chapter_num, exc_info=True)
+                await _report_progress(
+                    progress_callback, chapter_num, "failed", 0, chapter_index + 1, chapters_total
+                )
                 # Continue to next chapter rather than aborting.
                 chapter_metadata.append({
                     "number": chapter_num,
@@ -737,19 +762,9 @@ Rules:
             chapter_scores[str(chapter_num)] = 85
             scene_tags[f"Ch{chapter_num}"] = []
 
-            if progress_callback is not None:
-                try:
-                    cb = progress_callback({
-                        "chapter": chapter_num,
-                        "status": "ok",
-                        "word_count": word_count,
-                        "chapters_done": chapter_index + 1,
-                        "chapters_total": chapters_total,
-                    })
-                    if asyncio.iscoroutine(cb):
-                        await cb
-                except Exception:
-                    logger.debug("draft_generation: progress_callback raised for chapter %s", chapter_num, exc_info=True)
+            await _report_progress(
+                progress_callback, chapter_num, "ok", word_count, chapter_index + 1, chapters_total
+            )
 
         chapter_metadata.append({
             "number": chapter_num,
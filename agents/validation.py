@@ -12,9 +12,14 @@ These agents validate, edit, and finalize the manuscript:
 - Publishing Package
 """
 
+import re
+from collections import Counter
 from typing import Dict, Any, List
 from core.orchestrator import ExecutionContext
 
+# Word tokenizer for the manuscript-wide repetition scan in execute_final_proof.
+_WORD_RE = re.compile(r"[A-Za-z']+")
+
 
 # =============================================================================
 # EXECUTOR FUNCTIONS
@@ -1000,8 +1005,6 @@ async def execute_final_proof(context: ExecutionContext) -> Dict[str, Any]:
       repetition scan across all chapters in Python.
     - If no LLM: do repetition scan + basic heuristics only.
     """
-    import re
-
     llm = context.llm_client
     chapters = _best_available_chapters(context)
     style_guide = context.inputs.get("style_guide") or context.inputs.get("voice_specification", {}).get("style_guide", {})
@@ -1010,19 +1013,19 @@ async def execute_final_proof(context: ExecutionContext) -> Dict[str, Any]:
     consistency_findings: List[str] = []
 
     # Simple repetition scan across entire manuscript (no LLM)
-    phrase_counts: Dict[str, int] = {}
+    phrase_counts: Counter = Counter()
     for ch in chapters:
         if not isinstance(ch, dict):
             continue
         text = _chapter_text(ch)
         # Normalize and extract 3-6 word phrases
-        words = re.findall(r"[A-Za-z']+", text.lower())
+        words = _WORD_RE.findall(text.lower())
+        # zip over shifted slices builds the n-grams and Counter.update tallies
+        # them in C; phrases start at 0..len(words)-n-1 as before.
+        end = len(words) - 1
         for n in (3, 4):
-            for i in range(0, max(0, len(words) - n)):
-                phrase = " ".join(words[i : i + n])
-                if len(phrase) < 10:
-                    continue
-                phrase_counts[phrase] = phrase_counts.get(phrase, 0) + 1
+            phrases = map(" ".join, zip(*(words[k:end] for k in range(n))))
+            phrase_counts.update(p for p in phrases if len(p) >= 10)
 
     repeated = sorted([(p, c) for p, c in phrase_counts.items() if c >= 18], key=lambda x: x[1], reverse=True)[:10]
     if repeated:
@@ -13,6 +13,7 @@ import secrets
 import sys
 import time
 import json
+from functools import lru_cache
 from typing import Optional, List, Any, Dict
 
 # Load .env file before accessing environment variables
@@ -25,12 +26,13 @@ from fastapi.responses import StreamingResponse, FileResponse, HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
+import orjson
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.state import BookProject, LAYERS, AgentStatus, LayerStatus
-from models.agents import AGENT_REGISTRY, get_agent_execution_order
+from models.agents import AGENT_REGISTRY, get_agent_execution_order, get_agents_by_layer
 from core.orchestrator import Orchestrator
 from core.llm import create_llm_client
 
@@ -40,7 +42,6 @@ from agents.story_system import STORY_SYSTEM_EXECUTORS
 from agents.structural import STRUCTURAL_EXECUTORS
 from agents.validation import VALIDATION_EXECUTORS
 from agents.chapter_writer import execute_chapter_writer
-from core.schemas import AGENT_OUTPUT_MODELS
 from core.storage import get_project_store
 from core.jobs import JobManager
 from core.storage import get_job_store
@@ -125,8 +126,7 @@ def get_orchestrator():
     if not _projects_loaded:
         # Load persisted projects once.
         store = get_project_store()
-        for pid in store.list_project_ids():
-            data = store.load_raw(pid)
+        for data in store.load_all().values():
             if isinstance(data, dict):
                 try:
                     _orchestrator.import_project_state(data)
@@ -410,42 +410,56 @@ async def llm_status(auth: bool = Depends(require_auth)):
     }
 
 
-@app.get("/api/system/agents")
-async def list_agents(auth: bool = Depends(require_auth)):
-    """List all available agents."""
+# The registry, layer table and executor map are fixed once this module has
+# imported, so the system listings are encoded once and served as raw bytes.
+@lru_cache(maxsize=1)
+def _system_agents_json() -> bytes:
     agents = []
     for agent_id, agent_def in AGENT_REGISTRY.items():
         agents.append({
             "id": agent_def.agent_id,
             "name": agent_def.name,
             "layer": agent_def.layer,
-            "layer_name": LAYERS.get(agent_def.layer, "Unknown"),
+            "layer_name": agent_def.layer_name,
             "type": agent_def.agent_type.value,
             "purpose": agent_def.purpose,
             "gate": agent_def.gate_criteria,
             "fail_condition": agent_def.fail_condition,
             "has_executor": agent_def.agent_id in ALL_EXECUTORS,
         })
-    return {"agents": sorted(agents, key=lambda x: (x["layer"], x["id"]))}
+    return orjson.dumps({"agents": sorted(agents, key=lambda x: (x["layer"], x["id"]))})
 
 
-@app.get("/api/system/layers")
-async def list_layers(auth: bool = Depends(require_auth)):
-    """List all development layers."""
+@lru_cache(maxsize=1)
+def _system_layers_json() -> bytes:
     layers = []
     for layer_id, layer_name in LAYERS.items():
-        agents = [a.agent_id for a in AGENT_REGISTRY.values() if a.layer == layer_id]
+        agents = [a.agent_id for a in get_agents_by_layer(layer_id)]
         layers.append({
             "id": layer_id,
             "name": layer_name,
             "agents": agents
         })
-    return {"layers": layers}
+    return orjson.dumps({"layers": layers})
+
+
+@app.get("/api/system/agents")
+async def list_agents(auth: bool = Depends(require_auth)):
+    """List all available agents."""
+    return Response(content=_system_agents_json(), media_type="application/json")
+
+
+@app.get("/api/system/layers")
+async def list_layers(auth: bool = Depends(require_auth)):
+    """List all development layers."""
+    return Response(content=_system_layers_json(), media_type="application/json")
 
 
 @app.get("/api/system/executors-health")
 async def executors_health(auth: bool = Depends(require_auth)):
     """Check whether every registered agent has an executor."""
+    from core.schemas import AGENT_OUTPUT_MODELS
+
     missing = []
     for agent_id in AGENT_REGISTRY.keys():
         if agent_id not in ALL_EXECUTORS:
@@ -573,7 +587,7 @@ async def debug_availability(project_id: str, auth: bool = Depends(require_auth)
                 "agent_id": agent_id,
                 "name": agent_def.name,
                 "layer": agent_def.layer,
-                "layer_name": LAYERS.get(agent_def.layer, "Unknown"),
+                "layer_name": agent_def.layer_name,
             })
 
     diagnostics = orch.get_blocked_agents_diagnostics(project)
@@ -9,10 +9,13 @@ Generates professional book formats:
 
 import html
 import io
-import re
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 
+# Paragraphs that mark a scene break in chapter text.
+_SCENE_BREAKS = frozenset({'* * *', '---', '***'})
+_SCENE_BREAK_HTML = '<p style="text-align: center; margin: 2em 0;">* * *</p>\n'
+
 
 def _get_best_chapters(project, chapters_override: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
     if isinstance(chapters_override, list):
@@ -258,7 +261,7 @@ def generate_docx(project, include_outline: bool = False, chapters_override: Opt
                     para_text = para_text.strip()
                     if para_text:
                         # Handle scene breaks
-                        if para_text in ['* * *', '---', '***']:
+                        if para_text in _SCENE_BREAKS:
                             scene_break = doc.add_paragraph()
                             scene_break.alignment = WD_ALIGN_PARAGRAPH.CENTER
                             scene_break.add_run('* * *')
@@ -451,18 +454,20 @@ def generate_epub(project, chapters_override: Optional[List[Dict[str, Any]]] = N
             if text:
                 # Convert text to HTML paragraphs
                 paragraphs = text.split('\n\n')
-                html_content = f'<h1>Chapter {ch_num}: {html.escape(ch_title)}</h1>\n'
+                # Collect the pieces and join once instead of re-copying the
+                # growing chapter string for every paragraph.
+                parts = [f'<h1>Chapter {ch_num}: {html.escape(ch_title)}</h1>\n']
 
                 for para in paragraphs:
                     para = para.strip()
                     if para:
                         # Handle scene breaks
-                        if para in ['* * *', '---', '***']:
-                            html_content += '<p style="text-align: center; margin: 2em 0;">* * *</p>\n'
+                        if para in _SCENE_BREAKS:
+                            parts.append(_SCENE_BREAK_HTML)
                         else:
                             # Escape HTML entities
-                            para = para.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                            html_content += f'<p style="text-indent: 1.5em; margin: 0.5em 0;">{para}</p>\n'
+                            parts.append(f'<p style="text-indent: 1.5em; margin: 0.5em 0;">{html.escape(para, quote=False)}</p>\n')
+                html_content = ''.join(parts)
             else:
                 html_content = f'''
                 <h1>Chapter {ch_num}: {html.escape(ch_title)}</h1>
@@ -498,15 +503,15 @@ def generate_epub(project, chapters_override: Optional[List[Dict[str, Any]]] = N
     # Back matter (optional)
     if sup.get("acknowledgements"):
         acks = epub.EpubHtml(title="Acknowledgements", file_name="acknowledgements.xhtml", lang="en")
-        txt = sup["acknowledgements"].replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        txt = html.escape(sup["acknowledgements"], quote=False)
         acks.content = f"<html><head><title>Acknowledgements</title></head><body><h1>Acknowledgements</h1><p>{txt}</p></body></html>"
         book.add_item(acks)
         epub_chapters.append(acks)
 
     if sup.get("newsletter_cta") or sup.get("newsletter_url"):
         news = epub.EpubHtml(title="Stay in Touch", file_name="newsletter.xhtml", lang="en")
-        cta = sup.get("newsletter_cta", "").replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        url = sup.get("newsletter_url", "").replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        cta = html.escape(sup.get("newsletter_cta", ""), quote=False)
+        url = html.escape(sup.get("newsletter_url", ""), quote=False)
         parts = []
         if cta:
             parts.append(f"<p>{cta}</p>")
@@ -518,7 +523,7 @@ def generate_epub(project, chapters_override: Optional[List[Dict[str, Any]]] = N
 
     if sup.get("about_author"):
         about = epub.EpubHtml(title="About the Author", file_name="about_author.xhtml", lang="en")
-        txt = sup["about_author"].replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        txt = html.escape(sup["about_author"], quote=False)
         about.content = f"<html><head><title>About the Author</title></head><body><h1>About the Author</h1><p>{txt}</p></body></html>"
         book.add_item(about)
         epub_chapters.append(about)
@@ -14,8 +14,6 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, ValidationError
 
-from core.schemas import AGENT_OUTPUT_MODELS
-
 
 def _pydantic_errors(e: ValidationError) -> List[Dict[str, Any]]:
     errs: List[Dict[str, Any]] = []
@@ -55,6 +53,11 @@ def validate_agent_output(
     if content.get("_status") == "placeholder":
         return True, "Gate bypassed: placeholder output (demo mode).", {"placeholder": True}, content
 
+    # Deferred: building ~100 schema models is the bulk of this module's import
+    # cost, and storage-only code paths (project listing, job polling) import
+    # the orchestrator without ever validating an output.
+    from core.schemas import AGENT_OUTPUT_MODELS, validate_stage_output
+
     # 1) Required output keys (backwards-compatible with existing system)
     missing: List[str] = []
     if expected_outputs:
@@ -74,8 +77,11 @@ def validate_agent_output(
     normalized_content = content
     if model:
         try:
-            parsed: BaseModel = model.model_validate(content)
-            normalized_content = parsed.model_dump(mode="python")
+            # Per-agent prebuilt validator; the payload is validated as-is.
+            parsed: BaseModel = validate_stage_output(agent_id, content)
+            # JSON mode: tuple-typed schema fields come back as plain lists, the
+            # same shape a project reloaded from disk would have.
+            normalized_content = parsed.model_dump(mode="json")
             details["schema"] = "pydantic"
         except ValidationError as e:
             errors.extend(_pydantic_errors(e))
@@ -12,22 +12,29 @@ operation, swap the persistence + locking for Redis-based queueing.
 from __future__ import annotations
 
 import asyncio
+import logging
 import os
 import traceback
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
 from core.storage import get_job_store, get_project_store
-from models.state import BookProject
+from models.state import BookProject, _now_iso
+
+logger = logging.getLogger(__name__)
 
 # Seconds between heartbeat events during long-running agents.  30 s keeps
 # job.updated_at fresh and gives the UI a liveness signal without flooding
 # the event log during a typical 20-40 min draft_generation run.
 HEARTBEAT_INTERVAL: int = 30
 
+# Most recent events kept per job, in memory and on disk. A long draft run
+# emits a heartbeat every HEARTBEAT_INTERVAL plus per-chapter progress, so an
+# uncapped list would grow for the life of the job.
+MAX_JOB_EVENTS: int = 200
+
 
 class JobStatus(str, Enum):
     queued = "queued"
@@ -39,13 +46,13 @@ class JobStatus(str, Enum):
     interrupted = "interrupted"  # process restart / task lost
 
 
-@dataclass
+@dataclass(slots=True)
 class JobRecord:
     job_id: str
     project_id: str
     status: JobStatus = JobStatus.queued
-    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = field(default_factory=_now_iso)
     started_at: Optional[str] = None
     finished_at: Optional[str] = None
     error: Optional[str] = None
@@ -65,7 +72,7 @@ class JobRecord:
             "finished_at": self.finished_at,
             "error": self.error,
             "progress": self.progress,
-            "events": self.events[-200:],  # cap persisted chatter
+            "events": self.events[-MAX_JOB_EVENTS:],  # cap persisted chatter
             "cancel_requested": self.cancel_requested,
             "resumed_from_job_id": self.resumed_from_job_id,
         }
@@ -76,8 +83,8 @@ class JobRecord:
             job_id=str(data.get("job_id")),
             project_id=str(data.get("project_id")),
             status=JobStatus(str(data.get("status", JobStatus.queued.value))),
-            created_at=str(data.get("created_at", datetime.now(timezone.utc).isoformat())),
-            updated_at=str(data.get("updated_at", datetime.now(timezone.utc).isoformat())),
+            created_at=str(data.get("created_at", _now_iso())),
+            updated_at=str(data.get("updated_at", _now_iso())),
             started_at=data.get("started_at"),
             finished_at=data.get("finished_at"),
             error=data.get("error"),
@@ -112,7 +119,7 @@ class JobManager:
                 if job.status == JobStatus.running:
                     job.status = JobStatus.interrupted
                     job.error = "Job was interrupted (process restart). Start a new job to resume."
-                    job.finished_at = datetime.now(timezone.utc).isoformat()
+                    job.finished_at = _now_iso()
                 self._jobs[job.job_id] = job
                 store.save_raw(job.job_id, job.to_dict())
 
@@ -138,8 +145,7 @@ class JobManager:
         # Mark as running immediately so clients don't see a long "queued" period
         # before the async task gets CPU time.
         job.status = JobStatus.running
-        job.started_at = datetime.now(timezone.utc).isoformat()
-        job.updated_at = datetime.now(timezone.utc).isoformat()
+        job.started_at = job.updated_at = _now_iso()
         self._append_event(job, "start", "Job scheduled")
         store.save_raw(job.job_id, job.to_dict())
 
@@ -175,8 +181,7 @@ class JobManager:
         job = JobRecord(job_id=str(uuid.uuid4()), project_id=project.project_id, resumed_from_job_id=prior.job_id)
         store = get_job_store()
         job.status = JobStatus.running
-        job.started_at = datetime.now(timezone.utc).isoformat()
-        job.updated_at = datetime.now(timezone.utc).isoformat()
+        job.started_at = job.updated_at = _now_iso()
         self._append_event(job, "start", "Job scheduled (resume)", resumed_from=prior.job_id)
         store.save_raw(job.job_id, job.to_dict())
         async with self._lock:
@@ -199,7 +204,7 @@ class JobManager:
             if not job:
                 raise KeyError(job_id)
             job.cancel_requested = True
-            job.updated_at = datetime.now(timezone.utc).isoformat()
+            job.updated_at = _now_iso()
             store.save_raw(job.job_id, job.to_dict())
             return job
 
@@ -236,12 +241,15 @@ class JobManager:
     def _append_event(self, job: JobRecord, kind: str, message: str, **extra: Any) -> None:
         job.events.append(
             {
-                "ts": datetime.now(timezone.utc).isoformat(),
+                "ts": _now_iso(),
                 "kind": kind,
                 "message": message,
                 **extra,
             }
         )
+        # Trim in batches so the list isn't shifted on every append once full.
+        if len(job.events) >= 2 * MAX_JOB_EVENTS:
+            del job.events[:-MAX_JOB_EVENTS]
 
     async def _run_pipeline(self, *, job_id: str, orchestrator: Any, max_iterations: int) -> None:
         store = get_job_store()
@@ -253,8 +261,7 @@ class JobManager:
         async with self._lock:
             job = self._jobs[job_id]
             job.status = JobStatus.running
-            job.started_at = datetime.now(timezone.utc).isoformat()
-            job.updated_at = datetime.now(timezone.utc).isoformat()
+            job.started_at = job.updated_at = _now_iso()
             self._append_event(job, "start", "Job started")
             store.save_raw(job.job_id, job.to_dict())
 
@@ -269,8 +276,7 @@ class JobManager:
                 job = self._jobs[job_id]
                 job.status = JobStatus.failed
                 job.error = "Could not acquire job slot (MAX_CONCURRENT_JOBS limit). Try again or increase MAX_CONCURRENT_JOBS."
-                job.finished_at = datetime.now(timezone.utc).isoformat()
-                job.updated_at = datetime.now(timezone.utc).isoformat()
+                job.finished_at = job.updated_at = _now_iso()
                 self._append_event(job, "error", job.error)
                 store.save_raw(job.job_id, job.to_dict())
             return
@@ -289,8 +295,7 @@ class JobManager:
                     job = self._jobs[job_id]
                     if job.cancel_requested:
                         job.status = JobStatus.cancelled
-                        job.finished_at = datetime.now(timezone.utc).isoformat()
-                        job.updated_at = datetime.now(timezone.utc).isoformat()
+                        job.finished_at = job.updated_at = _now_iso()
                         self._append_event(job, "cancel", "Cancellation requested; stopping.")
                         store.save_raw(job.job_id, job.to_dict())
                         return
@@ -340,8 +345,7 @@ class JobManager:
                                 layer_status_counts=diagnostics["layer_status_counts"],
                                 blocked_candidates=diagnostics["blocked_candidates"][:10],
                             )
-                        job.finished_at = datetime.now(timezone.utc).isoformat()
-                        job.updated_at = datetime.now(timezone.utc).isoformat()
+                        job.finished_at = job.updated_at = _now_iso()
                         store.save_raw(job.job_id, job.to_dict())
                     # Persist project state snapshot too
                     pstore.save_raw(project.project_id, orchestrator.export_project_state(project))
@@ -352,14 +356,30 @@ class JobManager:
 
                 # For long-running agents run a heartbeat alongside execution so
                 # job.updated_at advances and the UI knows the job is alive.
+                # It sleeps on agent_done rather than being cancelled, so it
+                # exits the moment the agent finishes and never mid-write.
+                agent_done = asyncio.Event()
+
                 async def _heartbeat(jid: str, aid: str, interval: int = HEARTBEAT_INTERVAL) -> None:
+                    loop = asyncio.get_running_loop()
                     while True:
-                        await asyncio.sleep(interval)
+                        started = loop.time()
+                        try:
+                            async with asyncio.timeout(interval):
+                                await agent_done.wait()
+                            return
+                        except TimeoutError:
+                            pass
+                        # A wake-up well past the interval means something is
+                        # blocking the event loop (sync I/O in an executor path).
+                        lag = loop.time() - started - interval
+                        if lag > interval / 2:
+                            logger.warning("Heartbeat for job %s (%s) ran %.1fs late; event loop was blocked", jid, aid, lag)
                         async with self._lock:
                             _job = self._jobs.get(jid)
                             if _job is None:
                                 return
-                            _job.updated_at = datetime.now(timezone.utc).isoformat()
+                            _job.updated_at = _now_iso()
                             self._append_event(_job, "heartbeat", f"Agent {aid} still running…")
                             store.save_raw(_job.job_id, _job.to_dict())
 
@@ -377,7 +397,7 @@ class JobManager:
                             **data,
                         )
                         _job.progress["draft_generation"] = data
-                        _job.updated_at = datetime.now(timezone.utc).isoformat()
+                        _job.updated_at = _now_iso()
                         store.save_raw(_job.job_id, _job.to_dict())
 
                 heartbeat_task = asyncio.create_task(_heartbeat(job_id, agent_id))
@@ -385,11 +405,8 @@ class JobManager:
                     cb = _draft_progress_cb if agent_id == "draft_generation" else None
                     output = await orchestrator.execute_agent(project, agent_id, progress_callback=cb)
                 finally:
-                    heartbeat_task.cancel()
-                    try:
-                        await heartbeat_task
-                    except asyncio.CancelledError:
-                        pass
+                    agent_done.set()
+                    await heartbeat_task
                 # Persist project after each step
                 pstore.save_raw(project.project_id, orchestrator.export_project_state(project))
 
@@ -407,7 +424,7 @@ class JobManager:
                         "current_agent": status.get("current_agent"),
                         "available_agents_count": len(status.get("available_agents") or []),
                     }
-                    job.updated_at = datetime.now(timezone.utc).isoformat()
+                    job.updated_at = _now_iso()
                     store.save_raw(job.job_id, job.to_dict())
 
                 iterations += 1
@@ -417,8 +434,7 @@ class JobManager:
                 job = self._jobs[job_id]
                 job.status = JobStatus.failed
                 job.error = f"Max iterations reached ({max_iterations})."
-                job.finished_at = datetime.now(timezone.utc).isoformat()
-                job.updated_at = datetime.now(timezone.utc).isoformat()
+                job.finished_at = job.updated_at = _now_iso()
                 self._append_event(job, "error", job.error)
                 store.save_raw(job.job_id, job.to_dict())
 
@@ -427,8 +443,7 @@ class JobManager:
                 job = self._jobs[job_id]
                 job.status = JobStatus.failed
                 job.error = f"{e}\n{traceback.format_exc()}"
-                job.finished_at = datetime.now(timezone.utc).isoformat()
-                job.updated_at = datetime.now(timezone.utc).isoformat()
+                job.finished_at = job.updated_at = _now_iso()
                 self._append_event(job, "exception", "Job failed with exception", error=str(e))
                 store.save_raw(job.job_id, job.to_dict())
 
@@ -470,8 +485,7 @@ class JobManager:
         job = JobRecord(job_id=str(uuid.uuid4()), project_id=project_id)
         store = get_job_store()
         job.status = JobStatus.running
-        job.started_at = datetime.now(timezone.utc).isoformat()
-        job.updated_at = datetime.now(timezone.utc).isoformat()
+        job.started_at = job.updated_at = _now_iso()
         job.progress = {
             "total": len(chapter_outline),
             "remaining": [c.get("number") for c in chapters_to_write],
@@ -534,8 +548,7 @@ class JobManager:
                     "Could not acquire job slot (MAX_CONCURRENT_JOBS limit). "
                     "Try again or increase MAX_CONCURRENT_JOBS."
                 )
-                job.finished_at = datetime.now(timezone.utc).isoformat()
-                job.updated_at = datetime.now(timezone.utc).isoformat()
+                job.finished_at = job.updated_at = _now_iso()
                 self._append_event(job, "error", job.error)
                 store.save_raw(job.job_id, job.to_dict())
             return
@@ -559,8 +572,7 @@ class JobManager:
                     job = self._jobs[job_id]
                     if job.cancel_requested:
                         job.status = JobStatus.cancelled
-                        job.finished_at = datetime.now(timezone.utc).isoformat()
-                        job.updated_at = datetime.now(timezone.utc).isoformat()
+                        job.finished_at = job.updated_at = _now_iso()
                         self._append_event(job, "cancel", "Cancellation requested; stopping.")
                         store.save_raw(job.job_id, job.to_dict())
                         return
@@ -662,7 +674,7 @@ class JobManager:
                         "failed": failed,
                         "quick_mode": quick_mode,
                     }
-                    job.updated_at = datetime.now(timezone.utc).isoformat()
+                    job.updated_at = _now_iso()
                     store.save_raw(job.job_id, job.to_dict())
 
             # All chapters attempted; compute final state.
@@ -699,8 +711,7 @@ class JobManager:
                         f"{len(remaining)} chapter(s) remaining."
                     )
                     self._append_event(job, "error", job.error)
-                job.finished_at = datetime.now(timezone.utc).isoformat()
-                job.updated_at = datetime.now(timezone.utc).isoformat()
+                job.finished_at = job.updated_at = _now_iso()
                 store.save_raw(job.job_id, job.to_dict())
 
         except Exception as e:
@@ -708,8 +719,7 @@ class JobManager:
                 job = self._jobs[job_id]
                 job.status = JobStatus.failed
                 job.error = f"{e}\n{traceback.format_exc()}"
-                job.finished_at = datetime.now(timezone.utc).isoformat()
-                job.updated_at = datetime.now(timezone.utc).isoformat()
+                job.finished_at = job.updated_at = _now_iso()
                 self._append_event(job, "exception", "Job failed with exception", error=str(e))
                 store.save_raw(job.job_id, job.to_dict())
 
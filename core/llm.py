@@ -12,6 +12,7 @@ import os
 from typing import Any, Optional
 
 import anthropic
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -107,7 +108,8 @@ class ClaudeLLMClient:
                 # Extract JSON from response (handle markdown code blocks / stray text)
                 json_str = self._extract_json(content)
                 try:
-                    return json.loads(json_str)
+                    # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+                    return orjson.loads(json_str)
                 except json.JSONDecodeError:
                     # One more attempt: ask Claude to repair its own JSON.
                     repaired = await self._repair_json_via_llm(content)
@@ -169,7 +171,7 @@ class ClaudeLLMClient:
         # Keep this bounded to avoid pathological behavior.
         for _ in range(25):
             try:
-                json.loads(candidate)
+                orjson.loads(candidate)
                 return candidate
             except Exception:
                 candidate = candidate[:-1].rstrip()
@@ -250,7 +252,7 @@ Content to repair:
             )
             fixed = response.content[0].text
             json_str = self._extract_json(fixed)
-            return json.loads(json_str)
+            return orjson.loads(json_str)
         except Exception:
             logger.exception("JSON repair attempt failed")
             return None
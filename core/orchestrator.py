@@ -17,7 +17,7 @@ from models.state import (
     BookProject, LayerState, AgentState, AgentOutput, GateResult,
     AgentStatus, LayerStatus, LAYERS
 )
-from models.agents import AGENT_REGISTRY, AgentDefinition, get_agent_execution_order
+from models.agents import AGENT_REGISTRY, AgentDefinition, get_agent_execution_order, get_agents_by_layer, producer_of
 from core.gates import validate_agent_output
 
 logger = logging.getLogger(__name__)
@@ -26,13 +26,16 @@ logger = logging.getLogger(__name__)
 DEFAULT_RETRY_LIMIT = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """Context passed to agent executors."""
     project: BookProject
     inputs: Dict[str, Any]
     agent_def: Optional[AgentDefinition] = None
     llm_client: Any = None  # LLM client for generation
+    # Scratch space for values derived from `inputs`, shared by every executor
+    # call made with this context (e.g. prompt sections reused across chapters).
+    memo: Dict[str, Any] = field(default_factory=dict)
 
 
 class Orchestrator:
@@ -84,14 +87,13 @@ class Orchestrator:
             )
 
             # Add agents for this layer
-            for agent_id, agent_def in AGENT_REGISTRY.items():
-                if agent_def.layer == layer_id:
-                    layer_state.agents[agent_id] = AgentState(
-                        agent_id=agent_id,
-                        name=agent_def.name,
-                        layer=layer_id,
-                        dependencies=agent_def.dependencies
-                    )
+            for agent_def in get_agents_by_layer(layer_id):
+                layer_state.agents[agent_def.agent_id] = AgentState(
+                    agent_id=agent_def.agent_id,
+                    name=agent_def.name,
+                    layer=layer_id,
+                    dependencies=agent_def.dependencies
+                )
 
             project.layers[layer_id] = layer_state
 
@@ -142,6 +144,13 @@ class Orchestrator:
 
     def _find_agent_state(self, project: BookProject, agent_id: str) -> Optional[AgentState]:
         """Find an agent's state across all layers."""
+        # Projects are laid out from the registry, so look in the agent's own
+        # layer first and only fall back to scanning every layer.
+        agent_def = AGENT_REGISTRY.get(agent_id)
+        if agent_def is not None:
+            layer = project.layers.get(agent_def.layer)
+            if layer is not None and agent_id in layer.agents:
+                return layer.agents[agent_id]
         for layer in project.layers.values():
             if agent_id in layer.agents:
                 return layer.agents[agent_id]
@@ -171,24 +180,17 @@ class Orchestrator:
             if dep_state and dep_state.current_output:
                 inputs[dep_id] = dep_state.current_output.content
 
-        # Build an output-name index once so lookups are O(1) instead of O(agents × inputs).
-        # project.layers is a plain dict with integer keys inserted in ascending order (0-20),
-        # so iteration is in layer-dependency order and earlier layers take precedence.
-        output_index: Dict[str, Any] = {}
-        for layer in project.layers.values():
-            for agent_state in layer.agents.values():
-                if agent_state.current_output:
-                    content = agent_state.current_output.content
-                    if isinstance(content, dict):
-                        for k, v in content.items():
-                            # First writer wins — earlier layers take precedence
-                            if k not in output_index:
-                                output_index[k] = v
+        # Fallback index over every output key, built only for inputs that no
+        # user constraint, agent id, derived value or declared producer (see
+        # producer_of) resolves. A declared producer takes precedence over an
+        # earlier-layer agent that happens to emit the same key.
+        output_index: Optional[Dict[str, Any]] = None
 
         # Also search for specific named inputs
         for input_name in agent_def.inputs:
             if input_name in project.user_constraints:
                 inputs[input_name] = project.user_constraints[input_name]
+                continue
 
             # If the input name is an agent id, include that agent's full output
             # (this fixes common wiring issues like draft_generation needing chapter_blueprint).
@@ -196,15 +198,20 @@ class Orchestrator:
                 upstream = self._find_agent_state(project, input_name)
                 if upstream and upstream.current_output:
                     inputs[input_name] = upstream.current_output.content
+                    continue
 
-            # Derived inputs
+            # Derived inputs (user_constraints and title are already set above)
+            if input_name == "user_constraints":
+                continue
             if input_name == "title":
                 inputs["title"] = project.title
+                continue
             if input_name == "author_name":
                 c = project.user_constraints or {}
                 if isinstance(c, dict):
                     author = c.get("author_name") or c.get("pen_name") or "Author Name"
                     inputs["author_name"] = author
+                    continue
             if input_name == "character_names":
                 ca = self._find_agent_state(project, "character_architecture")
                 names: List[str] = []
@@ -219,20 +226,44 @@ class Orchestrator:
                     for s in cap.get("supporting_cast") or []:
                         if isinstance(s, dict) and s.get("name"):
                             names.append(s["name"])
-                # De-dup while preserving order
-                deduped: List[str] = []
-                for n in names:
-                    if n and n not in deduped:
-                        deduped.append(n)
+                # De-dup while preserving order (dict keys: hashed lookups, insertion order)
+                deduped = list(dict.fromkeys(n for n in names if n))
                 if deduped:
                     inputs["character_names"] = deduped
+                    continue
+
+            # Named outputs resolve straight to the agent that declares them.
+            producer = producer_of(input_name)
+            if producer:
+                state = self._find_agent_state(project, producer)
+                content = state.current_output.content if state and state.current_output else None
+                if isinstance(content, dict) and input_name in content:
+                    inputs[input_name] = content[input_name]
+                    continue
 
-            # O(1) lookup via pre-built index
+            if output_index is None:
+                output_index = self._build_output_index(project)
             if input_name in output_index:
                 inputs[input_name] = output_index[input_name]
 
         return inputs
 
+    @staticmethod
+    def _build_output_index(project: BookProject) -> Dict[str, Any]:
+        # project.layers is a plain dict with integer keys inserted in ascending order (0-20),
+        # so iteration is in layer-dependency order and earlier layers take precedence.
+        output_index: Dict[str, Any] = {}
+        for layer in project.layers.values():
+            for agent_state in layer.agents.values():
+                if agent_state.current_output:
+                    content = agent_state.current_output.content
+                    if isinstance(content, dict):
+                        for k, v in content.items():
+                            # First writer wins — earlier layers take precedence
+                            if k not in output_index:
+                                output_index[k] = v
+        return output_index
+
     async def execute_agent(
         self,
         project: BookProject,
@@ -346,7 +377,7 @@ class Orchestrator:
             if gate_result.passed:
                 agent_state.status = AgentStatus.PASSED
                 agent_state.current_output = output
-                agent_state.outputs.append(output)
+                agent_state.add_output(output)
                 logger.info(f"Agent {agent_id} PASSED gate")
             else:
                 if agent_state.attempts >= agent_def.retry_limit:
@@ -581,7 +612,7 @@ Return ONLY corrected JSON (no markdown, no commentary)."""
                 agent_status_counts[ags] = agent_status_counts.get(ags, 0) + 1
 
                 # Only care about agents that could potentially run but are stuck
-                if agent_state.status.value != "pending":
+                if agent_state.status != AgentStatus.PENDING:
                     continue
 
                 unmet_deps: List[Dict[str, str]] = []
@@ -589,7 +620,7 @@ Return ONLY corrected JSON (no markdown, no commentary)."""
                     dep_state = self._find_agent_state(project, dep_id)
                     if dep_state is None:
                         unmet_deps.append({"dep_id": dep_id, "dep_status": "missing"})
-                    elif dep_state.status.value != "passed":
+                    elif dep_state.status != AgentStatus.PASSED:
                         unmet_deps.append({"dep_id": dep_id, "dep_status": dep_state.status.value})
 
                 if unmet_deps:
@@ -607,7 +638,7 @@ Return ONLY corrected JSON (no markdown, no commentary)."""
         # Explain why the *next* locked layer hasn't unlocked
         locked_layer_reasons: List[Dict[str, Any]] = []
         for layer_id, layer in project.layers.items():
-            if layer.status.value != "locked":
+            if layer.status != LayerStatus.LOCKED:
                 continue
             prev_layer_id = layer_id - 1
             if prev_layer_id not in project.layers:
@@ -616,7 +647,7 @@ Return ONLY corrected JSON (no markdown, no commentary)."""
             not_passed = [
                 {"agent_id": aid, "status": a.status.value}
                 for aid, a in prev_layer.agents.items()
-                if a.status.value != "passed"
+                if a.status != AgentStatus.PASSED
             ]
             locked_layer_reasons.append(
                 {
@@ -8,201 +8,243 @@ subjective literary quality.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
 
 
-class ReaderAvatar(BaseModel):
-    demographics: str = Field(min_length=3)
-    psychographics: str = Field(min_length=3)
-    reading_habits: str = Field(min_length=3)
-    problems_to_solve: List[str] = Field(min_length=1)
+# Shared constrained-string types. Reusing one annotation per length keeps the
+# schema small instead of declaring a separate Field(min_length=...) per field.
+MinStr1 = Annotated[str, StringConstraints(min_length=1)]
+MinStr2 = Annotated[str, StringConstraints(min_length=2)]
+MinStr3 = Annotated[str, StringConstraints(min_length=3)]
+MinStr8 = Annotated[str, StringConstraints(min_length=8)]
+MinStr10 = Annotated[str, StringConstraints(min_length=10)]
+MinStr20 = Annotated[str, StringConstraints(min_length=20)]
 
+# Read-only string collections (see FrozenBase) share the same treatment.
+NonEmptyStrTuple = Annotated[Tuple[str, ...], Field(min_length=1)]
+StrTupleMin2 = Annotated[Tuple[str, ...], Field(min_length=2)]
 
-class MarketGap(BaseModel):
-    unmet_need: str = Field(min_length=3)
-    timing: str = Field(min_length=3)
-    opportunity_size: str = Field(min_length=1)
+# Free-form mappings, likewise declared once and reused by every model.
+StrDict = Dict[str, str]
+IntDict = Dict[str, int]
+AnyDict = Dict[str, Any]
 
 
-class PositioningAngle(BaseModel):
-    unique_value: str = Field(min_length=3)
-    differentiators: List[str] = Field(min_length=1)
-    competitive_advantage: str = Field(min_length=3)
+class FrozenBase(BaseModel):
+    """Base for all agent output schemas.
 
+    Outputs are write-once: an agent produces them and downstream stages only
+    read them, so instances are frozen and never revalidated.
+    """
 
-class CompTitle(BaseModel):
-    title: str = Field(min_length=1)
-    strengths: List[str] = Field(default_factory=list)
-    gaps: List[str] = Field(default_factory=list)
+    # defer_build: validators are built on first use, so a process that only
+    # ever validates one or two stages doesn't pay for all of them at import.
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        revalidate_instances="never",
+        extra="ignore",
+        defer_build=True,
+    )
 
 
-class MarketIntelligenceOutput(BaseModel):
+class ReaderAvatar(FrozenBase):
+    demographics: MinStr3
+    psychographics: MinStr3
+    reading_habits: MinStr3
+    problems_to_solve: NonEmptyStrTuple
+
+
+class MarketGap(FrozenBase):
+    unmet_need: MinStr3
+    timing: MinStr3
+    opportunity_size: MinStr1
+
+
+class PositioningAngle(FrozenBase):
+    unique_value: MinStr3
+    differentiators: NonEmptyStrTuple
+    competitive_advantage: MinStr3
+
+
+class CompTitle(FrozenBase):
+    title: MinStr1
+    strengths: Tuple[str, ...] = ()
+    gaps: Tuple[str, ...] = ()
+
+
+class MarketIntelligenceOutput(FrozenBase):
     reader_avatar: ReaderAvatar
     market_gap: MarketGap
     positioning_angle: PositioningAngle
     comp_analysis: List[CompTitle] = Field(min_length=1)
 
 
-class CorePromise(BaseModel):
-    transformation: str = Field(min_length=3)
-    value: str = Field(min_length=3)
-    emotional_payoff: str = Field(min_length=3)
+class CorePromise(FrozenBase):
+    transformation: MinStr3
+    value: MinStr3
+    emotional_payoff: MinStr3
 
 
-class UniqueEngine(BaseModel):
-    mechanism: str = Field(min_length=3)
-    novelty: str = Field(min_length=3)
-    credibility: str = Field(min_length=3)
+class UniqueEngine(FrozenBase):
+    mechanism: MinStr3
+    novelty: MinStr3
+    credibility: MinStr3
 
 
-class ConceptDefinitionOutput(BaseModel):
-    one_line_hook: str = Field(min_length=8)
+class ConceptDefinitionOutput(FrozenBase):
+    one_line_hook: MinStr8
     core_promise: CorePromise
     unique_engine: UniqueEngine
-    elevator_pitch: str = Field(min_length=20)
+    elevator_pitch: MinStr20
 
 
-class ThemeStatement(BaseModel):
-    statement: str = Field(min_length=8)
-    universal_truth: str = Field(min_length=8)
-    argument: str = Field(min_length=8)
+class ThemeStatement(FrozenBase):
+    statement: MinStr8
+    universal_truth: MinStr8
+    argument: MinStr8
 
 
-class CounterTheme(BaseModel):
-    statement: str = Field(min_length=8)
-    represented_by: str = Field(min_length=3)
-    argument: str = Field(min_length=8)
+class CounterTheme(FrozenBase):
+    statement: MinStr8
+    represented_by: MinStr3
+    argument: MinStr8
 
 
-class ValueConflict(BaseModel):
-    value_a: str = Field(min_length=2)
-    value_b: str = Field(min_length=2)
-    why_incompatible: str = Field(min_length=8)
+class ValueConflict(FrozenBase):
+    value_a: MinStr2
+    value_b: MinStr2
+    why_incompatible: MinStr8
 
 
-class ThematicArchitectureOutput(BaseModel):
+class ThematicArchitectureOutput(FrozenBase):
     primary_theme: ThemeStatement
     counter_theme: CounterTheme
     value_conflict: ValueConflict
-    thematic_question: str = Field(min_length=8)
+    thematic_question: MinStr8
 
 
-class StakesLevel(BaseModel):
-    risk: str = Field(min_length=3)
-    consequence: str = Field(min_length=3)
+class StakesLevel(FrozenBase):
+    risk: MinStr3
+    consequence: MinStr3
 
 
-class StakesLadder(BaseModel):
+class StakesLadder(FrozenBase):
     level_1: StakesLevel
     level_2: StakesLevel
     level_3: StakesLevel
 
 
-class BinaryOutcome(BaseModel):
-    success: str = Field(min_length=3)
-    failure: str = Field(min_length=3)
+class BinaryOutcome(FrozenBase):
+    success: MinStr3
+    failure: MinStr3
 
 
-class ReaderInvestment(BaseModel):
-    relatability: str = Field(min_length=3)
-    emotional_hooks: List[str] = Field(min_length=1)
-    curiosity_drivers: List[str] = Field(min_length=1)
+class ReaderInvestment(FrozenBase):
+    relatability: MinStr3
+    emotional_hooks: NonEmptyStrTuple
+    curiosity_drivers: NonEmptyStrTuple
 
 
-class StoryQuestionOutput(BaseModel):
-    central_dramatic_question: str = Field(min_length=8)
+class StoryQuestionOutput(FrozenBase):
+    central_dramatic_question: MinStr8
     stakes_ladder: StakesLadder
     binary_outcome: BinaryOutcome
     reader_investment: ReaderInvestment
 
 
-class PhysicalRules(BaseModel):
-    possibilities: List[str] = Field(min_length=1)
-    impossibilities: List[str] = Field(default_factory=list)
-    technology: str = Field(min_length=1)
-    geography: str = Field(min_length=1)
+class PhysicalRules(FrozenBase):
+    possibilities: NonEmptyStrTuple
+    impossibilities: Tuple[str, ...] = ()
+    technology: MinStr1
+    geography: MinStr1
 
 
-class SocialRules(BaseModel):
-    power_structures: str = Field(min_length=1)
-    norms: List[str] = Field(min_length=1)
-    taboos: List[str] = Field(default_factory=list)
-    economics: str = Field(min_length=1)
+class SocialRules(FrozenBase):
+    power_structures: MinStr1
+    norms: NonEmptyStrTuple
+    taboos: Tuple[str, ...] = ()
+    economics: MinStr1
 
 
-class PowerRules(BaseModel):
-    who_has_power: str = Field(min_length=1)
-    how_gained: str = Field(min_length=1)
-    how_lost: str = Field(min_length=1)
-    limitations: List[str] = Field(default_factory=list)
+class PowerRules(FrozenBase):
+    who_has_power: MinStr1
+    how_gained: MinStr1
+    how_lost: MinStr1
+    limitations: Tuple[str, ...] = ()
 
 
-class WorldBible(BaseModel):
-    relevant_history: str = Field(min_length=1)
-    culture: str = Field(min_length=1)
-    terminology: Dict[str, Any] = Field(default_factory=dict)
+class WorldBible(FrozenBase):
+    relevant_history: MinStr1
+    culture: MinStr1
+    terminology: AnyDict = Field(default_factory=dict)
 
 
-class WorldRulesOutput(BaseModel):
+class WorldRulesOutput(FrozenBase):
     physical_rules: PhysicalRules
     social_rules: SocialRules
     power_rules: PowerRules
     world_bible: WorldBible
-    constraint_list: List[str] = Field(min_length=1)
+    constraint_list: NonEmptyStrTuple
+
+
+class _NamedEntity(FrozenBase):
+    """Shared `name` field for character-like records."""
 
+    name: MinStr1
 
-class ProtagonistProfile(BaseModel):
-    name: str = Field(min_length=1)
-    role: str = Field(min_length=1)
-    traits: List[str] = Field(min_length=1)
-    backstory_wound: str = Field(min_length=3)
-    skills: List[str] = Field(default_factory=list)
-    weaknesses: List[str] = Field(default_factory=list)
 
+class _NamedRole(_NamedEntity):
+    role: MinStr1
 
-class ProtagonistArc(BaseModel):
-    starting_state: str = Field(min_length=3)
-    ending_state: str = Field(min_length=3)
-    transformation: str = Field(min_length=3)
 
+class ProtagonistProfile(_NamedRole):
+    traits: NonEmptyStrTuple
+    backstory_wound: MinStr3
+    skills: Tuple[str, ...] = ()
+    weaknesses: Tuple[str, ...] = ()
 
-class WantVsNeed(BaseModel):
-    want: str = Field(min_length=3)
-    need: str = Field(min_length=3)
-    conflict: str = Field(min_length=8)
 
+class ProtagonistArc(FrozenBase):
+    starting_state: MinStr3
+    ending_state: MinStr3
+    transformation: MinStr3
 
-class AntagonistProfile(BaseModel):
-    name: str = Field(min_length=1)
-    role: str = Field(min_length=1)
-    worldview: str = Field(min_length=3)
-    opposition_reason: str = Field(min_length=3)
-    strength: str = Field(min_length=3)
 
+class WantVsNeed(FrozenBase):
+    want: MinStr3
+    need: MinStr3
+    conflict: MinStr8
 
-class AntagonisticForce(BaseModel):
-    external: str = Field(min_length=1)
-    internal: str = Field(min_length=1)
-    societal: str = Field(min_length=1)
 
+class AntagonistProfile(_NamedRole):
+    worldview: MinStr3
+    opposition_reason: MinStr3
+    strength: MinStr3
 
-class SupportingCharacter(BaseModel):
-    name: str = Field(min_length=1)
-    function: str = Field(min_length=1)
-    challenge: str = Field(min_length=1)
-    arc: str = Field(min_length=1)
 
+class AntagonisticForce(FrozenBase):
+    external: MinStr1
+    internal: MinStr1
+    societal: MinStr1
 
-class CharacterFunctions(BaseModel):
-    mentor: str = Field(min_length=1)
-    ally: str = Field(min_length=1)
-    shapeshifter: str = Field(min_length=1)
-    threshold_guardian: str = Field(min_length=1)
 
+class SupportingCharacter(_NamedEntity):
+    function: MinStr1
+    challenge: MinStr1
+    arc: MinStr1
 
-class CharacterArchitectureOutput(BaseModel):
+
+class CharacterFunctions(FrozenBase):
+    mentor: MinStr1
+    ally: MinStr1
+    shapeshifter: MinStr1
+    threshold_guardian: MinStr1
+
+
+class CharacterArchitectureOutput(FrozenBase):
     protagonist_profile: ProtagonistProfile
     protagonist_arc: ProtagonistArc
     want_vs_need: WantVsNeed
@@ -212,86 +254,86 @@ class CharacterArchitectureOutput(BaseModel):
     character_functions: CharacterFunctions
 
 
-class ConflictWebItem(BaseModel):
-    characters: List[str] = Field(min_length=2)
-    tension: str = Field(min_length=3)
-    source: str = Field(min_length=3)
-    each_wants: Dict[str, str] = Field(default_factory=dict)
+class ConflictWebItem(FrozenBase):
+    characters: StrTupleMin2
+    tension: MinStr3
+    source: MinStr3
+    each_wants: StrDict = Field(default_factory=dict)
 
 
-class PowerShiftItem(BaseModel):
-    characters: List[str] = Field(min_length=2)
-    initial_balance: str = Field(min_length=3)
-    shift_moment: str = Field(min_length=3)
-    final_state: str = Field(min_length=3)
+class PowerShiftItem(FrozenBase):
+    characters: StrTupleMin2
+    initial_balance: MinStr3
+    shift_moment: MinStr3
+    final_state: MinStr3
 
 
-class DependencyArcItem(BaseModel):
-    dependent: str = Field(min_length=1)
-    provider: str = Field(min_length=1)
-    nature: str = Field(min_length=3)
-    evolution: str = Field(min_length=3)
-    breaking_point: str = Field(min_length=3)
+class DependencyArcItem(FrozenBase):
+    dependent: MinStr1
+    provider: MinStr1
+    nature: MinStr3
+    evolution: MinStr3
+    breaking_point: MinStr3
 
 
-class RelationshipMatrixItem(BaseModel):
-    char_a: str = Field(min_length=1)
-    char_b: str = Field(min_length=1)
-    type: str = Field(min_length=1)
-    start_state: str = Field(min_length=3)
-    end_state: str = Field(min_length=3)
+class RelationshipMatrixItem(FrozenBase):
+    char_a: MinStr1
+    char_b: MinStr1
+    type: MinStr1
+    start_state: MinStr3
+    end_state: MinStr3
 
 
-class RelationshipDynamicsOutput(BaseModel):
+class RelationshipDynamicsOutput(FrozenBase):
     conflict_web: List[ConflictWebItem] = Field(min_length=1)
     power_shifts: List[PowerShiftItem] = Field(min_length=1)
     dependency_arcs: List[DependencyArcItem] = Field(min_length=1)
     relationship_matrix: List[RelationshipMatrixItem] = Field(min_length=1)
 
 
-class PlotAct(BaseModel):
+class PlotAct(FrozenBase):
     percentage: int = Field(ge=1, le=100)
-    purpose: str = Field(min_length=3)
-    key_events: List[str] = Field(min_length=1)
+    purpose: MinStr3
+    key_events: NonEmptyStrTuple
 
 
-class ActStructure(BaseModel):
+class ActStructure(FrozenBase):
     act_1: PlotAct
     act_2: PlotAct
     act_3: PlotAct
 
 
-class MajorBeat(BaseModel):
-    name: str = Field(min_length=1)
-    description: str = Field(min_length=3)
-    page_target: str = Field(min_length=1)
+class MajorBeat(FrozenBase):
+    name: MinStr1
+    description: MinStr3
+    page_target: MinStr1
 
 
-class Reversal(BaseModel):
-    name: str = Field(min_length=1)
-    what_changes: str = Field(min_length=3)
-    impact: str = Field(min_length=3)
+class Reversal(FrozenBase):
+    name: MinStr1
+    what_changes: MinStr3
+    impact: MinStr3
 
 
-class PointOfNoReturn(BaseModel):
-    moment: str = Field(min_length=3)
-    why_irreversible: str = Field(min_length=3)
-    protagonist_commitment: str = Field(min_length=3)
+class PointOfNoReturn(FrozenBase):
+    moment: MinStr3
+    why_irreversible: MinStr3
+    protagonist_commitment: MinStr3
 
 
-class ClimaxDesign(BaseModel):
-    setup: str = Field(min_length=3)
-    confrontation: str = Field(min_length=3)
-    resolution: str = Field(min_length=3)
+class ClimaxDesign(FrozenBase):
+    setup: MinStr3
+    confrontation: MinStr3
+    resolution: MinStr3
 
 
-class Resolution(BaseModel):
-    external_resolution: str = Field(min_length=3)
-    internal_resolution: str = Field(min_length=3)
-    final_image: str = Field(min_length=3)
+class Resolution(FrozenBase):
+    external_resolution: MinStr3
+    internal_resolution: MinStr3
+    final_image: MinStr3
 
 
-class PlotStructureOutput(BaseModel):
+class PlotStructureOutput(FrozenBase):
     act_structure: ActStructure
     major_beats: List[MajorBeat] = Field(min_length=1)
     reversals: List[Reversal] = Field(min_length=1)
@@ -300,122 +342,122 @@ class PlotStructureOutput(BaseModel):
     resolution: Resolution
 
 
-class TensionPoint(BaseModel):
-    point: str = Field(min_length=1)
+class TensionPoint(FrozenBase):
+    point: MinStr1
     level: int = Field(ge=1, le=10)
-    description: str = Field(min_length=3)
+    description: MinStr3
 
 
-class DensitySection(BaseModel):
-    action_reflection_ratio: str = Field(min_length=3)
-    dialogue_description: str = Field(min_length=3)
+class DensitySection(FrozenBase):
+    action_reflection_ratio: MinStr3
+    dialogue_description: MinStr3
 
 
-class SceneDensityMap(BaseModel):
+class SceneDensityMap(FrozenBase):
     act_1: DensitySection
     act_2_first_half: DensitySection
     act_2_second_half: DensitySection
     act_3: DensitySection
 
 
-class BreatherPoint(BaseModel):
-    after: str = Field(min_length=1)
-    type: str = Field(min_length=1)
-    purpose: str = Field(min_length=3)
+class BreatherPoint(FrozenBase):
+    after: MinStr1
+    type: MinStr1
+    purpose: MinStr3
 
 
-class AccelerationZone(BaseModel):
-    section: str = Field(min_length=1)
-    technique: str = Field(min_length=3)
-    effect: str = Field(min_length=3)
+class AccelerationZone(FrozenBase):
+    section: MinStr1
+    technique: MinStr3
+    effect: MinStr3
 
 
-class PacingDesignOutput(BaseModel):
+class PacingDesignOutput(FrozenBase):
     tension_curve: List[TensionPoint] = Field(min_length=3)
     scene_density_map: SceneDensityMap
-    breather_points: List[BreatherPoint] = Field(default_factory=list)
-    acceleration_zones: List[AccelerationZone] = Field(default_factory=list)
+    breather_points: Tuple[BreatherPoint, ...] = ()
+    acceleration_zones: Tuple[AccelerationZone, ...] = ()
 
 
-class BlueprintScene(BaseModel):
+class BlueprintScene(FrozenBase):
     scene_number: int = Field(ge=1)
-    scene_question: str = Field(min_length=3)
-    characters: List[str] = Field(min_length=1)
-    location: str = Field(min_length=1)
-    conflict_type: str = Field(min_length=1)
-    outcome: str = Field(min_length=1)
+    scene_question: MinStr3
+    characters: NonEmptyStrTuple
+    location: MinStr1
+    conflict_type: MinStr1
+    outcome: MinStr1
     word_target: int = Field(ge=100)
 
 
-class BlueprintChapter(BaseModel):
+class BlueprintChapter(FrozenBase):
     number: int = Field(ge=1)
-    title: str = Field(min_length=1)
+    title: MinStr1
     act: int = Field(ge=1, le=3)
-    chapter_goal: str = Field(min_length=3)
-    pov: str = Field(min_length=1)
-    opening_hook: str = Field(min_length=3)
-    closing_hook: str = Field(min_length=3)
+    chapter_goal: MinStr3
+    pov: MinStr1
+    opening_hook: MinStr3
+    closing_hook: MinStr3
     word_target: int = Field(ge=300)
     scenes: List[BlueprintScene] = Field(min_length=1)
 
 
-class Hooks(BaseModel):
-    chapter_hooks: List[str] = Field(default_factory=list)
-    scene_hooks: List[str] = Field(default_factory=list)
+class Hooks(FrozenBase):
+    chapter_hooks: Tuple[str, ...] = ()
+    scene_hooks: Tuple[str, ...] = ()
 
 
-class ChapterBlueprintOutput(BaseModel):
+class ChapterBlueprintOutput(FrozenBase):
     chapter_outline: List[BlueprintChapter] = Field(min_length=3)
-    chapter_goals: Dict[str, str] = Field(default_factory=dict)
-    scene_list: List[str] = Field(default_factory=list)
-    scene_questions: Dict[str, str] = Field(default_factory=dict)
+    chapter_goals: StrDict = Field(default_factory=dict)
+    scene_list: Tuple[str, ...] = ()
+    scene_questions: StrDict = Field(default_factory=dict)
     hooks: Hooks = Field(default_factory=Hooks)
-    pov_assignments: Dict[str, str] = Field(default_factory=dict)
+    pov_assignments: StrDict = Field(default_factory=dict)
 
 
-class NarrativeVoice(BaseModel):
-    pov_type: str = Field(min_length=3)
-    distance: str = Field(min_length=1)
-    personality: str = Field(min_length=3)
-    tone: str = Field(min_length=3)
+class NarrativeVoice(FrozenBase):
+    pov_type: MinStr3
+    distance: MinStr1
+    personality: MinStr3
+    tone: MinStr3
 
 
-class PovRules(BaseModel):
-    perspective_character: str = Field(min_length=1)
-    knowledge_limits: str = Field(min_length=3)
-    rules: List[str] = Field(min_length=1)
+class PovRules(FrozenBase):
+    perspective_character: MinStr1
+    knowledge_limits: MinStr3
+    rules: NonEmptyStrTuple
 
 
-class TenseRules(BaseModel):
-    primary_tense: str = Field(min_length=2)
-    exceptions: List[str] = Field(default_factory=list)
+class TenseRules(FrozenBase):
+    primary_tense: MinStr2
+    exceptions: Tuple[str, ...] = ()
 
 
-class SyntaxPatterns(BaseModel):
-    avg_sentence_length: str = Field(min_length=1)
-    complexity: str = Field(min_length=1)
-    rhythm: str = Field(min_length=1)
+class SyntaxPatterns(FrozenBase):
+    avg_sentence_length: MinStr1
+    complexity: MinStr1
+    rhythm: MinStr1
 
 
-class SensoryDensity(BaseModel):
-    visual: str = Field(min_length=1)
-    other_senses: str = Field(min_length=1)
-    frequency: str = Field(min_length=1)
+class SensoryDensity(FrozenBase):
+    visual: MinStr1
+    other_senses: MinStr1
+    frequency: MinStr1
 
 
-class DialogueStyle(BaseModel):
-    tag_approach: str = Field(min_length=1)
-    subtext_level: str = Field(min_length=1)
-    differentiation: str = Field(min_length=1)
+class DialogueStyle(FrozenBase):
+    tag_approach: MinStr1
+    subtext_level: MinStr1
+    differentiation: MinStr1
 
 
-class StyleGuide(BaseModel):
-    dos: List[str] = Field(min_length=1)
-    donts: List[str] = Field(min_length=1)
-    example_passages: List[str] = Field(min_length=1)
+class StyleGuide(FrozenBase):
+    dos: NonEmptyStrTuple
+    donts: NonEmptyStrTuple
+    example_passages: NonEmptyStrTuple
 
 
-class VoiceSpecificationOutput(BaseModel):
+class VoiceSpecificationOutput(FrozenBase):
     narrative_voice: NarrativeVoice
     pov_rules: PovRules
     tense_rules: TenseRules
@@ -425,122 +467,122 @@ class VoiceSpecificationOutput(BaseModel):
     style_guide: StyleGuide
 
 
-class ChapterText(BaseModel):
+class ChapterText(FrozenBase):
     number: int = Field(ge=1)
-    title: str = Field(min_length=1)
-    text: str = Field(min_length=1)
-    summary: str = Field(min_length=1)
+    title: MinStr1
+    text: MinStr1
+    summary: MinStr1
     word_count: int = Field(ge=0)
 
 
-class ChapterMetadataItem(BaseModel):
+class ChapterMetadataItem(FrozenBase):
     number: int = Field(ge=1)
-    title: str = Field(min_length=1)
+    title: MinStr1
     scenes: int = Field(ge=0)
-    pov: str = Field(min_length=1)
+    pov: MinStr1
 
 
-class DraftGenerationOutput(BaseModel):
+class DraftGenerationOutput(FrozenBase):
     chapters: List[ChapterText] = Field(min_length=1)
     chapter_metadata: List[ChapterMetadataItem] = Field(min_length=1)
-    word_counts: Dict[str, int] = Field(default_factory=dict)
-    scene_tags: Dict[str, Any] = Field(default_factory=dict)
-    outline_adherence: Dict[str, Any] = Field(default_factory=dict)
-    chapter_scores: Dict[str, int] = Field(default_factory=dict)
-    deviations: List[Dict[str, Any]] = Field(default_factory=list)
-    fix_plan: List[str] = Field(default_factory=list)
+    word_counts: IntDict = Field(default_factory=dict)
+    scene_tags: AnyDict = Field(default_factory=dict)
+    outline_adherence: AnyDict = Field(default_factory=dict)
+    chapter_scores: IntDict = Field(default_factory=dict)
+    deviations: Tuple[AnyDict, ...] = ()
+    fix_plan: Tuple[str, ...] = ()
 
 
-class AuditIssue(BaseModel):
+class AuditIssue(FrozenBase):
     chapter: Optional[int] = Field(default=None, ge=1)
-    location: str = Field(min_length=1)
+    location: MinStr1
     severity: Literal["critical", "major", "minor"] = "minor"
-    description: str = Field(min_length=3)
-    suggested_fix: str = Field(min_length=3)
+    description: MinStr3
+    suggested_fix: MinStr3
 
 
-class AuditCheck(BaseModel):
+class AuditCheck(FrozenBase):
     status: Literal["passed", "failed", "warning"] = "passed"
-    issues: List[AuditIssue] = Field(default_factory=list)
-    notes: str = Field(min_length=1)
+    issues: Tuple[AuditIssue, ...] = ()
+    notes: MinStr1
 
 
-class ContinuityReport(BaseModel):
+class ContinuityReport(FrozenBase):
     total_issues: int = Field(ge=0)
     critical_issues: int = Field(ge=0)
     warnings: int = Field(ge=0)
-    recommendation: str = Field(min_length=3)
+    recommendation: MinStr3
 
 
-class ContinuityAuditOutput(BaseModel):
+class ContinuityAuditOutput(FrozenBase):
     timeline_check: AuditCheck
     character_logic_check: AuditCheck
     world_rule_check: AuditCheck
     continuity_report: ContinuityReport
 
 
-class ArcFulfillmentCheck(BaseModel):
+class ArcFulfillmentCheck(FrozenBase):
     protagonist_arc_complete: bool
     transformation_earned: bool
     supporting_arcs_resolved: bool
-    notes: str = Field(min_length=1)
+    notes: MinStr1
 
 
-class EmotionalPeak(BaseModel):
+class EmotionalPeak(FrozenBase):
     chapter: int = Field(ge=1)
-    type: str = Field(min_length=1)
+    type: MinStr1
     intensity: int = Field(ge=1, le=10)
 
 
-class EmotionalValidationOutput(BaseModel):
-    scene_resonance_scores: Dict[str, Any]
+class EmotionalValidationOutput(FrozenBase):
+    scene_resonance_scores: AnyDict
     arc_fulfillment_check: ArcFulfillmentCheck
-    emotional_peaks_map: List[EmotionalPeak] = Field(default_factory=list)
+    emotional_peaks_map: Tuple[EmotionalPeak, ...] = ()
 
 
-class StructuralSimilarityReport(BaseModel):
-    similar_works_found: List[str] = Field(default_factory=list)
-    similarity_level: str = Field(min_length=1)
-    unique_elements: List[str] = Field(default_factory=list)
+class StructuralSimilarityReport(FrozenBase):
+    similar_works_found: Tuple[str, ...] = ()
+    similarity_level: MinStr1
+    unique_elements: Tuple[str, ...] = ()
 
 
-class PhraseRecurrenceCheck(BaseModel):
-    overused_phrases: List[str] = Field(default_factory=list)
-    cliches_found: List[str] = Field(default_factory=list)
-    recommendation: str = Field(min_length=1)
+class PhraseRecurrenceCheck(FrozenBase):
+    overused_phrases: Tuple[str, ...] = ()
+    cliches_found: Tuple[str, ...] = ()
+    recommendation: MinStr1
 
 
-class OriginalityScanOutput(BaseModel):
+class OriginalityScanOutput(FrozenBase):
     structural_similarity_report: StructuralSimilarityReport
     phrase_recurrence_check: PhraseRecurrenceCheck
     originality_score: int = Field(ge=0, le=100)
 
 
-class SimilarityCheck(BaseModel):
-    status: str = Field(min_length=1)
-    flags: List[str] = Field(default_factory=list)
+class SimilarityCheck(FrozenBase):
+    status: MinStr1
+    flags: Tuple[str, ...] = ()
     confidence: int = Field(ge=0, le=100)
 
 
-class LikenessCheck(BaseModel):
-    status: str = Field(min_length=1)
-    similar_characters: List[str] = Field(default_factory=list)
-    notes: str = Field(min_length=1)
+class LikenessCheck(FrozenBase):
+    status: MinStr1
+    similar_characters: Tuple[str, ...] = ()
+    notes: MinStr1
 
 
-class SceneReplicationCheck(BaseModel):
-    status: str = Field(min_length=1)
-    similar_scenes: List[str] = Field(default_factory=list)
-    notes: str = Field(min_length=1)
+class SceneReplicationCheck(FrozenBase):
+    status: MinStr1
+    similar_scenes: Tuple[str, ...] = ()
+    notes: MinStr1
 
 
-class ProtectedExpressionCheck(BaseModel):
-    status: str = Field(min_length=1)
-    flags: List[str] = Field(default_factory=list)
-    notes: str = Field(min_length=1)
+class ProtectedExpressionCheck(FrozenBase):
+    status: MinStr1
+    flags: Tuple[str, ...] = ()
+    notes: MinStr1
 
 
-class PlagiarismAuditOutput(BaseModel):
+class PlagiarismAuditOutput(FrozenBase):
     substantial_similarity_check: SimilarityCheck
     character_likeness_check: LikenessCheck
     scene_replication_check: SceneReplicationCheck
@@ -548,65 +590,65 @@ class PlagiarismAuditOutput(BaseModel):
     legal_risk_score: int = Field(ge=0, le=100)
 
 
-class IndependentCreationProof(BaseModel):
+class IndependentCreationProof(FrozenBase):
     documented: bool
-    creation_timeline: str = Field(min_length=1)
-    influence_sources: str = Field(min_length=1)
+    creation_timeline: MinStr1
+    influence_sources: MinStr1
 
 
-class MarketConfusionCheck(BaseModel):
-    risk_level: str = Field(min_length=1)
-    similar_titles: List[str] = Field(default_factory=list)
-    recommendation: str = Field(min_length=1)
+class MarketConfusionCheck(FrozenBase):
+    risk_level: MinStr1
+    similar_titles: Tuple[str, ...] = ()
+    recommendation: MinStr1
 
 
-class TransformativeDistance(BaseModel):
+class TransformativeDistance(FrozenBase):
     score: int = Field(ge=0, le=100)
-    analysis: str = Field(min_length=3)
+    analysis: MinStr3
 
 
-class TransformativeVerificationOutput(BaseModel):
+class TransformativeVerificationOutput(FrozenBase):
     independent_creation_proof: IndependentCreationProof
     market_confusion_check: MarketConfusionCheck
     transformative_distance: TransformativeDistance
 
 
-class RevisionLogItem(BaseModel):
+class RevisionLogItem(FrozenBase):
     chapter: int = Field(ge=1)
-    changes: str = Field(min_length=3)
+    changes: MinStr3
 
 
-class StructuralRewriteOutput(BaseModel):
+class StructuralRewriteOutput(FrozenBase):
     revised_chapters: List[ChapterText] = Field(min_length=1)
-    revision_log: List[RevisionLogItem] = Field(default_factory=list)
+    revision_log: Tuple[RevisionLogItem, ...] = ()
     resolved_flags: int = Field(ge=0)
 
 
-class RewriteOriginalityCheck(BaseModel):
-    status: str = Field(min_length=1)
-    new_issues: List[str] = Field(default_factory=list)
+class RewriteOriginalityCheck(FrozenBase):
+    status: MinStr1
+    new_issues: Tuple[str, ...] = ()
 
 
-class PostRewriteScanOutput(BaseModel):
+class PostRewriteScanOutput(FrozenBase):
     rewrite_originality_check: RewriteOriginalityCheck
-    new_similarity_flags: List[str] = Field(default_factory=list)
+    new_similarity_flags: Tuple[str, ...] = ()
 
 
-class EditReport(BaseModel):
+class EditReport(FrozenBase):
     total_changes: int = Field(ge=0)
     major_changes: int = Field(ge=0)
     minor_changes: int = Field(ge=0)
-    readability_improvement: str = Field(min_length=1)
+    readability_improvement: MinStr1
 
 
-class LineEditOutput(BaseModel):
+class LineEditOutput(FrozenBase):
     edited_chapters: List[ChapterText] = Field(min_length=1)
     grammar_fixes: int = Field(ge=0)
     rhythm_improvements: int = Field(ge=0)
     edit_report: EditReport
 
 
-class EngagementScores(BaseModel):
+class EngagementScores(FrozenBase):
     opening: float = Field(ge=0, le=10)
     middle: float = Field(ge=0, le=10)
     climax: float = Field(ge=0, le=10)
@@ -614,133 +656,133 @@ class EngagementScores(BaseModel):
     overall: float = Field(ge=0, le=10)
 
 
-class FeedbackSummary(BaseModel):
-    strengths: List[str] = Field(default_factory=list)
-    weaknesses: List[str] = Field(default_factory=list)
-    quotes: List[str] = Field(default_factory=list)
+class FeedbackSummary(FrozenBase):
+    strengths: Tuple[str, ...] = ()
+    weaknesses: Tuple[str, ...] = ()
+    quotes: Tuple[str, ...] = ()
 
 
-class BetaSimulationOutput(BaseModel):
-    dropoff_points: List[str] = Field(default_factory=list)
-    confusion_zones: List[str] = Field(default_factory=list)
+class BetaSimulationOutput(FrozenBase):
+    dropoff_points: Tuple[str, ...] = ()
+    confusion_zones: Tuple[str, ...] = ()
     engagement_scores: EngagementScores
     feedback_summary: FeedbackSummary
 
 
-class ThemePayoffCheck(BaseModel):
+class ThemePayoffCheck(FrozenBase):
     theme_delivered: bool
     thematic_question_addressed: bool
     value_conflict_resolved: bool
 
 
-class PromiseFulfillment(BaseModel):
+class PromiseFulfillment(FrozenBase):
     core_promise_delivered: bool
     reader_expectation_met: bool
     emotional_payoff_achieved: bool
 
 
-class ReleaseRecommendation(BaseModel):
+class ReleaseRecommendation(FrozenBase):
     approved: bool
     confidence: int = Field(ge=0, le=100)
-    notes: str = Field(min_length=1)
+    notes: MinStr1
 
 
-class FinalValidationOutput(BaseModel):
+class FinalValidationOutput(FrozenBase):
     concept_match_score: int = Field(ge=0, le=100)
     theme_payoff_check: ThemePayoffCheck
     promise_fulfillment: PromiseFulfillment
     release_recommendation: ReleaseRecommendation
 
 
-class ProductionReadinessOutput(BaseModel):
+class ProductionReadinessOutput(FrozenBase):
     quality_score: int = Field(ge=0, le=100)
-    release_blockers: List[str] = Field(default_factory=list)
-    major_issues: List[str] = Field(default_factory=list)
-    minor_issues: List[str] = Field(default_factory=list)
-    recommended_actions: List[str] = Field(default_factory=list)
+    release_blockers: Tuple[str, ...] = ()
+    major_issues: Tuple[str, ...] = ()
+    minor_issues: Tuple[str, ...] = ()
+    recommended_actions: Tuple[str, ...] = ()
 
 
-class HumanEditorReviewOutput(BaseModel):
+class HumanEditorReviewOutput(FrozenBase):
     approved: bool
     confidence: int = Field(ge=0, le=100)
-    editorial_letter: str = Field(min_length=10)
-    required_changes: List[str] = Field(default_factory=list)
-    optional_suggestions: List[str] = Field(default_factory=list)
+    editorial_letter: MinStr10
+    required_changes: Tuple[str, ...] = ()
+    optional_suggestions: Tuple[str, ...] = ()
 
 
-class PublishingMetadata(BaseModel):
-    title: str = Field(min_length=1)
-    genre: str = Field(min_length=1)
+class PublishingMetadata(FrozenBase):
+    title: MinStr1
+    genre: MinStr1
     word_count: int = Field(ge=0)
-    audience: str = Field(min_length=1)
+    audience: MinStr1
 
 
-class PublishingPackageOutput(BaseModel):
-    blurb: str = Field(min_length=1)
-    synopsis: str = Field(min_length=1)
+class PublishingPackageOutput(FrozenBase):
+    blurb: MinStr1
+    synopsis: MinStr1
     metadata: PublishingMetadata
-    keywords: List[str] = Field(min_length=1)
-    series_hooks: List[str] = Field(default_factory=list)
-    author_bio: str = Field(min_length=1)
+    keywords: NonEmptyStrTuple
+    series_hooks: Tuple[str, ...] = ()
+    author_bio: MinStr1
 
 
-class TitleConflictCheck(BaseModel):
-    status: str = Field(min_length=1)
-    similar_titles: List[str] = Field(default_factory=list)
-    recommendation: str = Field(min_length=1)
+class TitleConflictCheck(FrozenBase):
+    status: MinStr1
+    similar_titles: Tuple[str, ...] = ()
+    recommendation: MinStr1
 
 
-class SeriesNamingCheck(BaseModel):
-    status: str = Field(min_length=1)
-    conflicts: List[str] = Field(default_factory=list)
+class SeriesNamingCheck(FrozenBase):
+    status: MinStr1
+    conflicts: Tuple[str, ...] = ()
 
 
-class CharacterNamingCheck(BaseModel):
-    status: str = Field(min_length=1)
-    conflicts: List[str] = Field(default_factory=list)
+class CharacterNamingCheck(FrozenBase):
+    status: MinStr1
+    conflicts: Tuple[str, ...] = ()
 
 
-class ClearanceStatus(BaseModel):
+class ClearanceStatus(FrozenBase):
     approved: bool
-    notes: str = Field(min_length=1)
+    notes: MinStr1
 
 
-class IPClearanceOutput(BaseModel):
+class IPClearanceOutput(FrozenBase):
     title_conflict_check: TitleConflictCheck
     series_naming_check: SeriesNamingCheck
     character_naming_check: CharacterNamingCheck
     clearance_status: ClearanceStatus
 
 
-class ExportSubReport(BaseModel):
+class ExportSubReport(FrozenBase):
     generated: bool
     valid: bool
-    issues: List[str] = Field(default_factory=list)
-    details: Dict[str, Any] = Field(default_factory=dict)
+    issues: Tuple[str, ...] = ()
+    details: AnyDict = Field(default_factory=dict)
 
 
-class FrontMatterReport(BaseModel):
-    included_pages: List[str] = Field(default_factory=list)
-    missing_recommended: List[str] = Field(default_factory=list)
+class FrontMatterReport(FrozenBase):
+    included_pages: Tuple[str, ...] = ()
+    missing_recommended: Tuple[str, ...] = ()
 
 
-class KDPReadinessOutput(BaseModel):
+class KDPReadinessOutput(FrozenBase):
     kindle_ready: bool
     epub_report: ExportSubReport
     docx_report: ExportSubReport
     front_matter_report: FrontMatterReport
-    recommendations: List[str] = Field(default_factory=list)
+    recommendations: Tuple[str, ...] = ()
 
 
-class FinalProofOutput(BaseModel):
+class FinalProofOutput(FrozenBase):
     approved: bool
     overall_score: int = Field(ge=0, le=100)
     critical_issues: int = Field(ge=0)
     major_issues: int = Field(ge=0)
     minor_issues: int = Field(ge=0)
-    per_chapter_issues: List[Dict[str, Any]] = Field(default_factory=list)
-    consistency_findings: List[str] = Field(default_factory=list)
-    recommended_actions: List[str] = Field(default_factory=list)
+    per_chapter_issues: Tuple[AnyDict, ...] = ()
+    consistency_findings: Tuple[str, ...] = ()
+    recommended_actions: Tuple[str, ...] = ()
 
 AGENT_OUTPUT_MODELS: Dict[str, type[BaseModel]] = {
     "market_intelligence": MarketIntelligenceOutput,
@@ -773,3 +815,24 @@ AGENT_OUTPUT_MODELS: Dict[str, type[BaseModel]] = {
     "ip_clearance": IPClearanceOutput,
 }
 
+
+# Validators are built once per agent, on first use (models use defer_build), and
+# then reused; callers do one dict lookup and go straight to pydantic-core.
+AGENT_OUTPUT_VALIDATORS: Dict[str, TypeAdapter[Any]] = {}
+
+
+def validate_stage_output(agent_id: str, data: Any) -> FrozenBase:
+    """
+    Validate `data` against the output model registered for `agent_id`.
+
+    Raises KeyError for agents without a schema and pydantic.ValidationError
+    for invalid data.
+    """
+    return _stage_adapter(agent_id).validate_python(data)
+
+
+def _stage_adapter(agent_id: str) -> TypeAdapter[Any]:
+    adapter = AGENT_OUTPUT_VALIDATORS.get(agent_id)
+    if adapter is None:
+        adapter = AGENT_OUTPUT_VALIDATORS[agent_id] = TypeAdapter(AGENT_OUTPUT_MODELS[agent_id])
+    return adapter
@@ -2,17 +2,26 @@
 Simple project persistence layer (file-based).
 
 Railway restarts will wipe in-memory state. This store writes each project as a
-single JSON file so projects can be restored on startup.
+single (zstd-compressed) JSON file so projects can be restored on startup.
 
 Set PROJECT_STORAGE_DIR to a persistent volume path (recommended: /data/projects).
+Set PROJECT_STORAGE_BACKEND=sqlite to keep all projects in a single SQLite
+database in that directory instead of one file per project.
 """
 
 from __future__ import annotations
 
-import json
+import mmap
 import os
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+import orjson
+import zstandard as zstd
 
 
 def _default_storage_dir() -> str:
@@ -22,78 +31,297 @@ def _default_storage_dir() -> str:
     return os.path.join(os.getcwd(), "data", "projects")
 
 
-def _atomic_write_json(path: str, data: Dict[str, Any]) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+def _atomic_write_bytes(path: str, payload: bytes, ensured_dirs: Optional[Set[str]] = None) -> None:
+    # Stores pass the set of directories they've already created so steady-state
+    # saves skip the makedirs stat calls.
+    dirname = os.path.dirname(path)
+    if ensured_dirs is None or dirname not in ensured_dirs:
+        os.makedirs(dirname, exist_ok=True)
+        if ensured_dirs is not None:
+            ensured_dirs.add(dirname)
     tmp = f"{path}.tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # The payload is already one bytes blob, so write it straight to the fd;
+    # a buffered file object would only add a copy and an extra layer.
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
     os.replace(tmp, path)
 
 
-@dataclass
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    # Compact output: job files are machine-read and project files are compressed,
+    # so indentation would only add bytes and encoder work.
+    # OPT_NON_STR_KEYS keeps stdlib behaviour of stringifying int keys (e.g. layer ids).
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _atomic_write_json(path: str, data: Dict[str, Any], ensured_dirs: Optional[Set[str]] = None) -> None:
+    _atomic_write_bytes(path, _dump_json(data), ensured_dirs)
+
+
+# zstd contexts are not thread-safe; a fresh one per call is cheap next to the
+# payload size.
+def _compress(payload: bytes) -> bytes:
+    return zstd.ZstdCompressor(level=3).compress(payload)
+
+
+def _decompress(payload: bytes) -> bytes:
+    return zstd.ZstdDecompressor().decompress(payload)
+
+
+# Upper bound on threads used by FileProjectStore.load_all().
+_LOAD_WORKERS = 16
+
+# Files at least this large are parsed from an mmap and kept out of the byte cache.
+_MMAP_THRESHOLD = 1 << 20
+
+# Raw bytes of recently read project files, keyed by path. Each entry records the
+# (ino, mtime_ns, size) it was read at; every save os.replace()s a new inode into
+# place, so a rewrite fails the check and overwrites its own slot.
+_BYTES_CACHE_SIZE = 32
+_bytes_cache: "OrderedDict[str, Tuple[Tuple[int, int, int], bytes]]" = OrderedDict()
+_bytes_cache_lock = threading.Lock()
+
+
+def _read_bytes_cached(path: str, st: os.stat_result) -> bytes:
+    key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    with _bytes_cache_lock:
+        hit = _bytes_cache.get(path)
+        if hit is not None and hit[0] == key:
+            _bytes_cache.move_to_end(path)
+            return hit[1]
+    with open(path, "rb") as f:
+        raw = f.read()
+    with _bytes_cache_lock:
+        _bytes_cache[path] = (key, raw)
+        _bytes_cache.move_to_end(path)
+        while len(_bytes_cache) > _BYTES_CACHE_SIZE:
+            _bytes_cache.popitem(last=False)
+    return raw
+
+
+def _loads_mapped(path: str, compressed: bool) -> Dict[str, Any]:
+    # Parse straight from the page cache instead of copying the file into a
+    # bytes object first.
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if compressed:
+            return orjson.loads(_decompress(mm))
+        view = memoryview(mm)
+        try:
+            return orjson.loads(view)
+        finally:
+            view.release()
+
+
+def _load_json(path: str, compressed: bool = False, cached: bool = False) -> Optional[Dict[str, Any]]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    if st.st_size >= _MMAP_THRESHOLD:
+        return _loads_mapped(path, compressed)
+    if cached:
+        # Cache the bytes, not the parsed dict: callers mutate what they load, and
+        # a fresh orjson parse is cheaper than deep-copying a cached object.
+        raw = _read_bytes_cached(path, st)
+    else:
+        with open(path, "rb") as f:
+            raw = f.read()
+    if compressed:
+        raw = _decompress(raw)
+    return orjson.loads(raw)
+
+
+def _list_ids(base_dir: str, suffixes: Tuple[str, ...] = (".json",)) -> List[str]:
+    # scandir yields dirent types with the names, so is_file() needs no extra stat.
+    ids: Dict[str, None] = {}
+    try:
+        with os.scandir(base_dir) as it:
+            for e in it:
+                for suffix in suffixes:
+                    if e.name.endswith(suffix) and e.is_file(follow_symlinks=False):
+                        ids[e.name[: -len(suffix)]] = None
+                        break
+    except FileNotFoundError:
+        return []
+    return list(ids)
+
+
+@dataclass(slots=True, frozen=True)
 class FileProjectStore:
+    """
+    One zstd-compressed JSON file per project (`<id>.json.zst`).
+
+    Projects carry whole manuscripts, so compression cuts volume usage and
+    read/write bandwidth several-fold. Plain `<id>.json` files written by older
+    versions are still read, and are removed the next time the project is saved.
+    """
+
     base_dir: str
+    _ensured_dirs: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _prefix: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # base_dir never changes, so join once rather than on every path lookup.
+        object.__setattr__(self, "_prefix", os.path.join(self.base_dir, ""))
 
     def project_path(self, project_id: str) -> str:
-        return os.path.join(self.base_dir, f"{project_id}.json")
+        return f"{self._prefix}{project_id}.json.zst"
+
+    def legacy_project_path(self, project_id: str) -> str:
+        return f"{self._prefix}{project_id}.json"
 
     def list_project_ids(self) -> List[str]:
-        if not os.path.isdir(self.base_dir):
-            return []
-        ids: List[str] = []
-        for name in os.listdir(self.base_dir):
-            if name.endswith(".json"):
-                ids.append(name[:-5])
-        return ids
+        return _list_ids(self.base_dir, (".json.zst", ".json"))
 
     def load_raw(self, project_id: str) -> Optional[Dict[str, Any]]:
-        path = self.project_path(project_id)
-        if not os.path.exists(path):
+        data = _load_json(self.project_path(project_id), compressed=True, cached=True)
+        if data is None:
+            data = _load_json(self.legacy_project_path(project_id), cached=True)
+        return data
+
+    def load_all(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Load every stored project, keyed by id.
+
+        Reads fan out across a thread pool: decompression and parsing release
+        the GIL, so startup reload scales with disk rather than running serially.
+        Unreadable files map to None instead of aborting the whole load.
+        """
+        ids = self.list_project_ids()
+        if not ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(_LOAD_WORKERS, len(ids))) as ex:
+            return dict(zip(ids, ex.map(self._load_or_none, ids)))
+
+    def _load_or_none(self, project_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return self.load_raw(project_id)
+        except (OSError, ValueError, zstd.ZstdError):
             return None
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
 
     def save_raw(self, project_id: str, data: Dict[str, Any]) -> None:
-        _atomic_write_json(self.project_path(project_id), data)
+        _atomic_write_bytes(self.project_path(project_id), _compress(_dump_json(data)), self._ensured_dirs)
+        try:
+            os.remove(self.legacy_project_path(project_id))
+        except FileNotFoundError:
+            pass
+
+
+@dataclass(slots=True, frozen=True)
+class SqliteProjectStore:
+    """
+    All projects in one SQLite database (WAL mode), same orjson+zstd encoding.
+
+    Opt in with PROJECT_STORAGE_BACKEND=sqlite. Startup reload becomes one
+    query against one file instead of a directory scan plus N file opens.
+    Projects still stored as files next to the database are imported the
+    first time they are listed or loaded, so switching backends loses nothing.
+    """
+
+    db_path: str
+    _conn: sqlite3.Connection = field(init=False, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    _files: FileProjectStore = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        base_dir = os.path.dirname(self.db_path) or "."
+        os.makedirs(base_dir, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS projects (id TEXT PRIMARY KEY, blob BLOB NOT NULL)")
+        object.__setattr__(self, "_conn", conn)
+        object.__setattr__(self, "_files", FileProjectStore(base_dir=base_dir))
+
+    def list_project_ids(self) -> List[str]:
+        with self._lock:
+            ids = {row[0]: None for row in self._conn.execute("SELECT id FROM projects")}
+        for project_id in self._files.list_project_ids():
+            ids.setdefault(project_id, None)
+        return list(ids)
+
+    def load_raw(self, project_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT blob FROM projects WHERE id = ?", (project_id,)).fetchone()
+        if row is not None:
+            return orjson.loads(_decompress(row[0]))
+        return self._import_file(project_id)
+
+    def load_all(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Load every stored project, keyed by id, in a single query plus any file imports."""
+        with self._lock:
+            rows = self._conn.execute("SELECT id, blob FROM projects").fetchall()
+        out: Dict[str, Optional[Dict[str, Any]]] = {}
+        for project_id, blob in rows:
+            try:
+                out[project_id] = orjson.loads(_decompress(blob))
+            except (ValueError, zstd.ZstdError):
+                out[project_id] = None
+        for project_id in self._files.list_project_ids():
+            if project_id not in out:
+                try:
+                    out[project_id] = self._import_file(project_id)
+                except (OSError, ValueError, zstd.ZstdError):
+                    out[project_id] = None
+        return out
+
+    def save_raw(self, project_id: str, data: Dict[str, Any]) -> None:
+        blob = _compress(_dump_json(data))
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO projects (id, blob) VALUES (?, ?)", (project_id, blob))
 
+    def _import_file(self, project_id: str) -> Optional[Dict[str, Any]]:
+        # The file is left in place; from here on the database row shadows it.
+        data = self._files.load_raw(project_id)
+        if data is not None:
+            self.save_raw(project_id, data)
+        return data
 
-@dataclass
+
+ProjectStore = Union[FileProjectStore, SqliteProjectStore]
+
+
+@dataclass(slots=True, frozen=True)
 class FileJobStore:
     base_dir: str
+    _ensured_dirs: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _prefix: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_prefix", os.path.join(self.base_dir, ""))
 
     def job_path(self, job_id: str) -> str:
-        return os.path.join(self.base_dir, f"{job_id}.json")
+        return f"{self._prefix}{job_id}.json"
 
     def list_ids(self) -> List[str]:
-        if not os.path.isdir(self.base_dir):
-            return []
-        ids: List[str] = []
-        for name in os.listdir(self.base_dir):
-            if name.endswith(".json"):
-                ids.append(name[:-5])
-        return ids
+        return _list_ids(self.base_dir)
 
     def load_raw(self, job_id: str) -> Optional[Dict[str, Any]]:
-        path = self.job_path(job_id)
-        if not os.path.exists(path):
-            return None
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return _load_json(self.job_path(job_id))
 
     def save_raw(self, job_id: str, data: Dict[str, Any]) -> None:
-        _atomic_write_json(self.job_path(job_id), data)
+        _atomic_write_json(self.job_path(job_id), data, self._ensured_dirs)
 
 
-_store_singleton: Optional[FileProjectStore] = None
+_store_singleton: Optional[ProjectStore] = None
 _job_store_singleton: Optional[FileJobStore] = None
 
 
-def get_project_store() -> FileProjectStore:
+def get_project_store() -> ProjectStore:
     global _store_singleton
     if _store_singleton is None:
         base = os.environ.get("PROJECT_STORAGE_DIR") or _default_storage_dir()
-        _store_singleton = FileProjectStore(base_dir=base)
-        os.makedirs(_store_singleton.base_dir, exist_ok=True)
+        backend = (os.environ.get("PROJECT_STORAGE_BACKEND") or "file").strip().lower()
+        if backend == "sqlite":
+            _store_singleton = SqliteProjectStore(db_path=os.path.join(base, "projects.sqlite3"))
+        else:
+            _store_singleton = FileProjectStore(base_dir=base)
+            os.makedirs(_store_singleton.base_dir, exist_ok=True)
     return _store_singleton
 
 
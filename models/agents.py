@@ -9,10 +9,16 @@ Each agent has:
 - Fail condition: What causes rejection
 """
 
+import logging
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from enum import Enum
 
+from models.state import LAYERS
+
+logger = logging.getLogger(__name__)
+
 
 class AgentType(Enum):
     """Types of agents in the system."""
@@ -25,22 +31,32 @@ class AgentType(Enum):
     LEGAL = "legal"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentDefinition:
-    """Definition of an agent's capabilities and requirements."""
+    """
+    Definition of an agent's capabilities and requirements.
+
+    Registry entries are shared by every project and never change at runtime,
+    so instances are frozen and the id lists are tuples.
+    """
     agent_id: str
     name: str
     layer: int
     agent_type: AgentType
     purpose: str
-    inputs: List[str]  # Required inputs from other agents
-    outputs: List[str]  # What this agent produces
+    inputs: Tuple[str, ...]  # Required inputs from other agents
+    outputs: Tuple[str, ...]  # What this agent produces
     gate_criteria: str  # What must be true to pass
     fail_condition: str  # What causes failure
-    dependencies: List[str] = field(default_factory=list)  # Agent IDs that must complete first
-    prompts: Dict[str, str] = field(default_factory=dict)  # LLM prompts for this agent
+    dependencies: Tuple[str, ...] = ()  # Agent IDs that must complete first
+    prompts: Dict[str, str] = field(default_factory=dict, hash=False)  # LLM prompts for this agent
     retry_limit: int = 3
 
+    @property
+    def layer_name(self) -> str:
+        """Display name of this agent's layer (from models.state.LAYERS)."""
+        return LAYERS[self.layer]
+
 
 # =============================================================================
 # LAYER 0: ORCHESTRATION & STATE CONTROL
@@ -52,11 +68,11 @@ ORCHESTRATOR = AgentDefinition(
     layer=0,
     agent_type=AgentType.STRUCTURAL,
     purpose="Control flow, manage dependencies, handle versioning and checkpoints",
-    inputs=["user_constraints"],
-    outputs=["agent_map", "stage_order", "state_json", "checkpoint_rules"],
+    inputs=("user_constraints",),
+    outputs=("agent_map", "stage_order", "state_json", "checkpoint_rules"),
     gate_criteria="All agents registered and dependencies valid",
     fail_condition="Missing constraints or circular dependencies",
-    dependencies=[]
+    dependencies=()
 )
 
 
@@ -70,11 +86,11 @@ MARKET_INTELLIGENCE = AgentDefinition(
     layer=1,
     agent_type=AgentType.RESEARCH,
     purpose="Analyze market demand and define target reader",
-    inputs=["user_constraints", "genre", "comparable_titles"],
-    outputs=["reader_avatar", "market_gap", "positioning_angle", "comp_analysis"],
+    inputs=("user_constraints", "genre", "comparable_titles"),
+    outputs=("reader_avatar", "market_gap", "positioning_angle", "comp_analysis"),
     gate_criteria="Clear market differentiation identified",
     fail_condition="Commodity concept with no unique angle",
-    dependencies=["orchestrator"]
+    dependencies=("orchestrator",)
 )
 
 CONCEPT_DEFINITION = AgentDefinition(
@@ -83,11 +99,11 @@ CONCEPT_DEFINITION = AgentDefinition(
     layer=2,
     agent_type=AgentType.CREATIVE,
     purpose="Define the book's core promise and unique value",
-    inputs=["market_gap", "positioning_angle", "user_vision"],
-    outputs=["one_line_hook", "core_promise", "unique_engine", "elevator_pitch"],
+    inputs=("market_gap", "positioning_angle", "user_vision"),
+    outputs=("one_line_hook", "core_promise", "unique_engine", "elevator_pitch"),
     gate_criteria="Hook is clear, memorable, and marketable",
     fail_condition="Vague or generic premise",
-    dependencies=["market_intelligence"]
+    dependencies=("market_intelligence",)
 )
 
 THEMATIC_ARCHITECTURE = AgentDefinition(
@@ -96,11 +112,11 @@ THEMATIC_ARCHITECTURE = AgentDefinition(
     layer=3,
     agent_type=AgentType.CREATIVE,
     purpose="Establish the meaning layer and value conflicts",
-    inputs=["core_promise", "unique_engine"],
-    outputs=["primary_theme", "counter_theme", "value_conflict", "thematic_question"],
+    inputs=("core_promise", "unique_engine"),
+    outputs=("primary_theme", "counter_theme", "value_conflict", "thematic_question"),
     gate_criteria="Theme actively drives story conflict",
     fail_condition="Theme is decorative only, not structural",
-    dependencies=["concept_definition"]
+    dependencies=("concept_definition",)
 )
 
 STORY_QUESTION = AgentDefinition(
@@ -109,11 +125,11 @@ STORY_QUESTION = AgentDefinition(
     layer=4,
     agent_type=AgentType.CREATIVE,
     purpose="Define the narrative's central dramatic question",
-    inputs=["primary_theme", "value_conflict", "core_promise"],
-    outputs=["central_dramatic_question", "stakes_ladder", "binary_outcome", "reader_investment"],
+    inputs=("primary_theme", "value_conflict", "core_promise"),
+    outputs=("central_dramatic_question", "stakes_ladder", "binary_outcome", "reader_investment"),
     gate_criteria="Question has binary yes/no outcome with clear stakes",
     fail_condition="No real loss if protagonist fails",
-    dependencies=["thematic_architecture"]
+    dependencies=("thematic_architecture",)
 )
 
 
@@ -127,11 +143,11 @@ WORLD_RULES = AgentDefinition(
     layer=5,
     agent_type=AgentType.CREATIVE,
     purpose="Define the constraints and rules of the story world",
-    inputs=["central_dramatic_question", "genre", "user_constraints"],
-    outputs=["physical_rules", "social_rules", "power_rules", "world_bible", "constraint_list"],
+    inputs=("central_dramatic_question", "genre", "user_constraints"),
+    outputs=("physical_rules", "social_rules", "power_rules", "world_bible", "constraint_list"),
     gate_criteria="Constraints actively enforce story tension",
     fail_condition="Rules break plot or remove tension",
-    dependencies=["story_question"]
+    dependencies=("story_question",)
 )
 
 CHARACTER_ARCHITECTURE = AgentDefinition(
@@ -140,15 +156,15 @@ CHARACTER_ARCHITECTURE = AgentDefinition(
     layer=6,
     agent_type=AgentType.CREATIVE,
     purpose="Design characters as agents of thematic change",
-    inputs=["primary_theme", "central_dramatic_question", "world_rules"],
-    outputs=[
+    inputs=("primary_theme", "central_dramatic_question", "world_rules"),
+    outputs=(
         "protagonist_profile", "protagonist_arc", "want_vs_need",
         "antagonist_profile", "antagonistic_force",
         "supporting_cast", "character_functions"
-    ],
+    ),
     gate_criteria="Every character pressures the theme",
     fail_condition="Passive protagonist or purposeless characters",
-    dependencies=["world_rules"]
+    dependencies=("world_rules",)
 )
 
 RELATIONSHIP_DYNAMICS = AgentDefinition(
@@ -157,11 +173,11 @@ RELATIONSHIP_DYNAMICS = AgentDefinition(
     layer=7,
     agent_type=AgentType.CREATIVE,
     purpose="Map the emotional engine through character relationships",
-    inputs=["character_architecture", "primary_theme", "value_conflict"],
-    outputs=["conflict_web", "power_shifts", "dependency_arcs", "relationship_matrix"],
+    inputs=("character_architecture", "primary_theme", "value_conflict"),
+    outputs=("conflict_web", "power_shifts", "dependency_arcs", "relationship_matrix"),
     gate_criteria="Relationships evolve meaningfully through story",
     fail_condition="Static interactions that don't change",
-    dependencies=["character_architecture"]
+    dependencies=("character_architecture",)
 )
 
 
@@ -175,14 +191,14 @@ PLOT_STRUCTURE = AgentDefinition(
     layer=8,
     agent_type=AgentType.STRUCTURAL,
     purpose="Design the story's momentum and major beats",
-    inputs=["central_dramatic_question", "protagonist_arc", "relationship_dynamics"],
-    outputs=[
+    inputs=("central_dramatic_question", "protagonist_arc", "relationship_dynamics"),
+    outputs=(
         "act_structure", "major_beats", "reversals",
         "point_of_no_return", "climax_design", "resolution"
-    ],
+    ),
     gate_criteria="Clear escalation through all acts",
     fail_condition="Flat middle or unearned climax",
-    dependencies=["relationship_dynamics"]
+    dependencies=("relationship_dynamics",)
 )
 
 PACING_DESIGN = AgentDefinition(
@@ -191,11 +207,11 @@ PACING_DESIGN = AgentDefinition(
     layer=9,
     agent_type=AgentType.STRUCTURAL,
     purpose="Control reader energy and engagement rhythm",
-    inputs=["plot_structure", "act_structure", "genre"],
-    outputs=["tension_curve", "scene_density_map", "breather_points", "acceleration_zones"],
+    inputs=("plot_structure", "act_structure", "genre"),
+    outputs=("tension_curve", "scene_density_map", "breather_points", "acceleration_zones"),
     gate_criteria="No dead zones in tension",
     fail_condition="Prolonged low tension or reader fatigue",
-    dependencies=["plot_structure"]
+    dependencies=("plot_structure",)
 )
 
 CHAPTER_BLUEPRINT = AgentDefinition(
@@ -204,14 +220,14 @@ CHAPTER_BLUEPRINT = AgentDefinition(
     layer=10,
     agent_type=AgentType.STRUCTURAL,
     purpose="Create detailed execution map for writing",
-    inputs=["plot_structure", "pacing_design", "character_architecture"],
-    outputs=[
+    inputs=("plot_structure", "pacing_design", "character_architecture"),
+    outputs=(
         "chapter_outline", "chapter_goals", "scene_list",
         "scene_questions", "hooks", "pov_assignments"
-    ],
+    ),
     gate_criteria="Each chapter changes story state",
     fail_condition="Filler scenes with no purpose",
-    dependencies=["pacing_design"]
+    dependencies=("pacing_design",)
 )
 
 
@@ -225,15 +241,15 @@ VOICE_SPECIFICATION = AgentDefinition(
     layer=11,
     agent_type=AgentType.CREATIVE,
     purpose="Define consistent narrative voice and style rules",
-    inputs=["genre", "reader_avatar", "protagonist_profile", "user_constraints"],
-    outputs=[
+    inputs=("genre", "reader_avatar", "protagonist_profile", "user_constraints"),
+    outputs=(
         "narrative_voice", "pov_rules", "tense_rules",
         "syntax_patterns", "sensory_density", "dialogue_style",
         "style_guide"
-    ],
+    ),
     gate_criteria="Style test passages pass consistency check",
     fail_condition="Voice drift or inconsistent tone",
-    dependencies=["chapter_blueprint"]
+    dependencies=("chapter_blueprint",)
 )
 
 
@@ -247,11 +263,11 @@ DRAFT_GENERATION = AgentDefinition(
     layer=12,
     agent_type=AgentType.GENERATION,
     purpose="Produce the manuscript chapters",
-    inputs=[
+    inputs=(
         "chapter_blueprint", "voice_specification", "character_architecture",
         "world_rules", "style_guide"
-    ],
-    outputs=[
+    ),
+    outputs=(
         "chapters",
         "chapter_metadata",
         "word_counts",
@@ -260,10 +276,10 @@ DRAFT_GENERATION = AgentDefinition(
         "chapter_scores",
         "deviations",
         "fix_plan",
-    ],
+    ),
     gate_criteria="Draft follows outline and voice spec",
     fail_condition="Off-outline drift or voice inconsistency",
-    dependencies=["voice_specification"]
+    dependencies=("voice_specification",)
 )
 
 
@@ -277,11 +293,11 @@ CONTINUITY_AUDIT = AgentDefinition(
     layer=13,
     agent_type=AgentType.VALIDATION,
     purpose="Verify canon integrity and internal consistency",
-    inputs=["chapters", "world_rules", "character_architecture", "chapter_blueprint"],
-    outputs=["timeline_check", "character_logic_check", "world_rule_check", "continuity_report"],
+    inputs=("chapters", "world_rules", "character_architecture", "chapter_blueprint"),
+    outputs=("timeline_check", "character_logic_check", "world_rule_check", "continuity_report"),
     gate_criteria="Zero contradictions in canon",
     fail_condition="Canon breaks or timeline errors",
-    dependencies=["draft_generation"]
+    dependencies=("draft_generation",)
 )
 
 EMOTIONAL_VALIDATION = AgentDefinition(
@@ -290,11 +306,11 @@ EMOTIONAL_VALIDATION = AgentDefinition(
     layer=14,
     agent_type=AgentType.VALIDATION,
     purpose="Verify reader payoff and emotional resonance",
-    inputs=["chapters", "protagonist_arc", "stakes_ladder", "tension_curve"],
-    outputs=["scene_resonance_scores", "arc_fulfillment_check", "emotional_peaks_map"],
+    inputs=("chapters", "protagonist_arc", "stakes_ladder", "tension_curve"),
+    outputs=("scene_resonance_scores", "arc_fulfillment_check", "emotional_peaks_map"),
     gate_criteria="Emotional peaks land as designed",
     fail_condition="Flat climax or unearned emotions",
-    dependencies=["continuity_audit"]
+    dependencies=("continuity_audit",)
 )
 
 
@@ -308,11 +324,11 @@ ORIGINALITY_SCAN = AgentDefinition(
     layer=15,
     agent_type=AgentType.LEGAL,
     purpose="Detect trope cloning and unintentional similarity",
-    inputs=["chapters", "plot_structure", "character_architecture"],
-    outputs=["structural_similarity_report", "phrase_recurrence_check", "originality_score"],
+    inputs=("chapters", "plot_structure", "character_architecture"),
+    outputs=("structural_similarity_report", "phrase_recurrence_check", "originality_score"),
     gate_criteria="Originality threshold met",
     fail_condition="Pattern collision with known works",
-    dependencies=["emotional_validation"]
+    dependencies=("emotional_validation",)
 )
 
 PLAGIARISM_AUDIT = AgentDefinition(
@@ -322,14 +338,14 @@ PLAGIARISM_AUDIT = AgentDefinition(
     agent_type=AgentType.LEGAL,
     purpose="Assess legal risk from similarity to existing works",
     # Use the producing agent id so orchestrator wiring is reliable.
-    inputs=["chapters", "originality_scan"],
-    outputs=[
+    inputs=("chapters", "originality_scan"),
+    outputs=(
         "substantial_similarity_check", "character_likeness_check",
         "scene_replication_check", "protected_expression_check", "legal_risk_score"
-    ],
+    ),
     gate_criteria="Low legal risk score",
     fail_condition="Infringement risk detected",
-    dependencies=["originality_scan"]
+    dependencies=("originality_scan",)
 )
 
 TRANSFORMATIVE_VERIFICATION = AgentDefinition(
@@ -338,11 +354,11 @@ TRANSFORMATIVE_VERIFICATION = AgentDefinition(
     layer=15,
     agent_type=AgentType.LEGAL,
     purpose="Verify legal defensibility of creative choices",
-    inputs=["chapters", "plagiarism_audit"],
-    outputs=["independent_creation_proof", "market_confusion_check", "transformative_distance"],
+    inputs=("chapters", "plagiarism_audit"),
+    outputs=("independent_creation_proof", "market_confusion_check", "transformative_distance"),
     gate_criteria="Sufficient transformative distance",
     fail_condition="Derivative exposure risk",
-    dependencies=["plagiarism_audit"]
+    dependencies=("plagiarism_audit",)
 )
 
 
@@ -357,11 +373,11 @@ STRUCTURAL_REWRITE = AgentDefinition(
     agent_type=AgentType.EDITING,
     purpose="Improve clarity, force, and resolve flagged issues",
     # Use producing agent ids so inputs are always discoverable.
-    inputs=["chapters", "continuity_audit", "emotional_validation", "originality_scan", "plagiarism_audit", "transformative_verification"],
-    outputs=["revised_chapters", "revision_log", "resolved_flags"],
+    inputs=("chapters", "continuity_audit", "emotional_validation", "originality_scan", "plagiarism_audit", "transformative_verification"),
+    outputs=("revised_chapters", "revision_log", "resolved_flags"),
     gate_criteria="All flagged issues resolved",
     fail_condition="New inconsistencies introduced",
-    dependencies=["transformative_verification"]
+    dependencies=("transformative_verification",)
 )
 
 POST_REWRITE_SCAN = AgentDefinition(
@@ -370,11 +386,11 @@ POST_REWRITE_SCAN = AgentDefinition(
     layer=16,
     agent_type=AgentType.LEGAL,
     purpose="Catch rewrite-introduced similarity",
-    inputs=["revised_chapters"],
-    outputs=["rewrite_originality_check", "new_similarity_flags"],
+    inputs=("revised_chapters",),
+    outputs=("rewrite_originality_check", "new_similarity_flags"),
     gate_criteria="Clean scan with no new flags",
     fail_condition="Reintroduced similarity patterns",
-    dependencies=["structural_rewrite"]
+    dependencies=("structural_rewrite",)
 )
 
 
@@ -388,11 +404,11 @@ LINE_EDIT = AgentDefinition(
     layer=17,
     agent_type=AgentType.EDITING,
     purpose="Polish prose for precision and rhythm",
-    inputs=["revised_chapters", "style_guide"],
-    outputs=["edited_chapters", "grammar_fixes", "rhythm_improvements", "edit_report"],
+    inputs=("revised_chapters", "style_guide"),
+    outputs=("edited_chapters", "grammar_fixes", "rhythm_improvements", "edit_report"),
     gate_criteria="Editorial standards met",
     fail_condition="Mechanical errors remain",
-    dependencies=["post_rewrite_scan"]
+    dependencies=("post_rewrite_scan",)
 )
 
 BETA_SIMULATION = AgentDefinition(
@@ -401,11 +417,11 @@ BETA_SIMULATION = AgentDefinition(
     layer=18,
     agent_type=AgentType.VALIDATION,
     purpose="Simulate market reader response",
-    inputs=["edited_chapters", "reader_avatar", "genre"],
-    outputs=["dropoff_points", "confusion_zones", "engagement_scores", "feedback_summary"],
+    inputs=("edited_chapters", "reader_avatar", "genre"),
+    outputs=("dropoff_points", "confusion_zones", "engagement_scores", "feedback_summary"),
     gate_criteria="Engagement sustained throughout",
     fail_condition="Reader abandonment predicted",
-    dependencies=["line_edit"]
+    dependencies=("line_edit",)
 )
 
 
@@ -419,11 +435,11 @@ FINAL_VALIDATION = AgentDefinition(
     layer=19,
     agent_type=AgentType.VALIDATION,
     purpose="Verify complete promise fulfillment",
-    inputs=["edited_chapters", "core_promise", "primary_theme", "central_dramatic_question"],
-    outputs=["concept_match_score", "theme_payoff_check", "promise_fulfillment", "release_recommendation"],
+    inputs=("edited_chapters", "core_promise", "primary_theme", "central_dramatic_question"),
+    outputs=("concept_match_score", "theme_payoff_check", "promise_fulfillment", "release_recommendation"),
     gate_criteria="Release approved",
     fail_condition="Core promise not delivered",
-    dependencies=["human_editor_review"]
+    dependencies=("human_editor_review",)
 )
 
 HUMAN_EDITOR_REVIEW = AgentDefinition(
@@ -432,7 +448,7 @@ HUMAN_EDITOR_REVIEW = AgentDefinition(
     layer=19,
     agent_type=AgentType.VALIDATION,
     purpose="Simulate a professional human editor's review with required changes and an editorial letter",
-    inputs=[
+    inputs=(
         "edited_chapters",
         "voice_specification",
         "chapter_blueprint",
@@ -441,11 +457,11 @@ HUMAN_EDITOR_REVIEW = AgentDefinition(
         "thematic_architecture",
         "story_question",
         "user_constraints",
-    ],
-    outputs=["approved", "confidence", "editorial_letter", "required_changes", "optional_suggestions"],
+    ),
+    outputs=("approved", "confidence", "editorial_letter", "required_changes", "optional_suggestions"),
     gate_criteria="approved=true and required_changes empty",
     fail_condition="Editor requests required changes before publication",
-    dependencies=["beta_simulation"]
+    dependencies=("beta_simulation",)
 )
 
 PRODUCTION_READINESS = AgentDefinition(
@@ -454,11 +470,11 @@ PRODUCTION_READINESS = AgentDefinition(
     layer=19,
     agent_type=AgentType.VALIDATION,
     purpose="Create a QA-style release checklist and blockers for publication",
-    inputs=["edited_chapters", "release_recommendation", "user_constraints"],
-    outputs=["quality_score", "release_blockers", "major_issues", "minor_issues", "recommended_actions"],
+    inputs=("edited_chapters", "release_recommendation", "user_constraints"),
+    outputs=("quality_score", "release_blockers", "major_issues", "minor_issues", "recommended_actions"),
     gate_criteria="No release blockers and quality_score >= 85",
     fail_condition="Release blockers present or quality score below threshold",
-    dependencies=["final_validation"]
+    dependencies=("final_validation",)
 )
 
 PUBLISHING_PACKAGE = AgentDefinition(
@@ -467,11 +483,11 @@ PUBLISHING_PACKAGE = AgentDefinition(
     layer=20,
     agent_type=AgentType.GENERATION,
     purpose="Create market-ready publishing materials",
-    inputs=["edited_chapters", "core_promise", "reader_avatar", "positioning_angle"],
-    outputs=["blurb", "synopsis", "metadata", "keywords", "series_hooks", "author_bio"],
+    inputs=("edited_chapters", "core_promise", "reader_avatar", "positioning_angle"),
+    outputs=("blurb", "synopsis", "metadata", "keywords", "series_hooks", "author_bio"),
     gate_criteria="Platform-ready package complete",
     fail_condition="Weak positioning or missing elements",
-    dependencies=["final_validation", "production_readiness"]
+    dependencies=("final_validation", "production_readiness")
 )
 
 KDP_READINESS = AgentDefinition(
@@ -480,11 +496,11 @@ KDP_READINESS = AgentDefinition(
     layer=20,
     agent_type=AgentType.VALIDATION,
     purpose="Validate EPUB/DOCX exports and ensure front/back matter readiness for Kindle publishing",
-    inputs=["edited_chapters", "publishing_package", "user_constraints", "title", "author_name"],
-    outputs=["kindle_ready", "epub_report", "docx_report", "front_matter_report", "recommendations"],
+    inputs=("edited_chapters", "publishing_package", "user_constraints", "title", "author_name"),
+    outputs=("kindle_ready", "epub_report", "docx_report", "front_matter_report", "recommendations"),
     gate_criteria="kindle_ready=true and no critical issues in export reports",
     fail_condition="EPUB/DOCX export validation fails or front matter is missing",
-    dependencies=["publishing_package", "final_proof"]
+    dependencies=("publishing_package", "final_proof")
 )
 
 FINAL_PROOF = AgentDefinition(
@@ -493,11 +509,11 @@ FINAL_PROOF = AgentDefinition(
     layer=20,
     agent_type=AgentType.EDITING,
     purpose="Run a full-manuscript proof/copy check and consistency scan before Kindle release",
-    inputs=["edited_chapters", "style_guide", "voice_specification", "chapter_blueprint", "user_constraints"],
-    outputs=["approved", "overall_score", "critical_issues", "major_issues", "minor_issues", "per_chapter_issues", "consistency_findings", "recommended_actions"],
+    inputs=("edited_chapters", "style_guide", "voice_specification", "chapter_blueprint", "user_constraints"),
+    outputs=("approved", "overall_score", "critical_issues", "major_issues", "minor_issues", "per_chapter_issues", "consistency_findings", "recommended_actions"),
     gate_criteria="approved=true and critical_issues=0",
     fail_condition="Critical proof issues remain",
-    dependencies=["production_readiness"]
+    dependencies=("production_readiness",)
 )
 
 IP_CLEARANCE = AgentDefinition(
@@ -506,11 +522,11 @@ IP_CLEARANCE = AgentDefinition(
     layer=20,
     agent_type=AgentType.LEGAL,
     purpose="Verify naming safety for publication",
-    inputs=["title", "character_names", "series_name"],
-    outputs=["title_conflict_check", "series_naming_check", "character_naming_check", "clearance_status"],
+    inputs=("title", "character_names", "series_name"),
+    outputs=("title_conflict_check", "series_naming_check", "character_naming_check", "clearance_status"),
     gate_criteria="All naming cleared",
     fail_condition="Rename required",
-    dependencies=["kdp_readiness"]
+    dependencies=("kdp_readiness",)
 )
 
 
@@ -562,27 +578,133 @@ AGENT_REGISTRY: Dict[str, AgentDefinition] = {
 }
 
 
+def _compute_agents_by_layer() -> Dict[int, Tuple[AgentDefinition, ...]]:
+    by_layer: Dict[int, List[AgentDefinition]] = {}
+    for a in AGENT_REGISTRY.values():
+        by_layer.setdefault(a.layer, []).append(a)
+    return {layer: tuple(agents) for layer, agents in by_layer.items()}
+
+
+def _index_graph() -> Tuple[Tuple[str, ...], List["array[int]"], List["array[int]"]]:
+    """
+    Integer view of the dependency graph.
+
+    Agents are numbered in registry order; each agent's dependencies and
+    dependents are packed int arrays of those positions.
+    """
+    ids = tuple(AGENT_REGISTRY)
+    bad_layers = [f"{agent_id} (layer {a.layer})" for agent_id, a in AGENT_REGISTRY.items() if a.layer not in LAYERS]
+    if bad_layers:
+        raise ValueError(f"Agents assigned to layers missing from LAYERS: {', '.join(bad_layers)}")
+    index = {agent_id: i for i, agent_id in enumerate(ids)}
+    missing = {
+        agent_id: [d for d in AGENT_REGISTRY[agent_id].dependencies if d not in index]
+        for agent_id in ids
+    }
+    missing = {agent_id: deps for agent_id, deps in missing.items() if deps}
+    if missing:
+        details = "; ".join(f"{agent_id} -> {', '.join(deps)}" for agent_id, deps in missing.items())
+        raise ValueError(f"Agents depend on unknown agent ids: {details}")
+    deps = [array("i", [index[d] for d in AGENT_REGISTRY[agent_id].dependencies]) for agent_id in ids]
+    dependents: List[List[int]] = [[] for _ in ids]
+    for i, row in enumerate(deps):
+        for d in row:
+            dependents[d].append(i)
+    return ids, deps, [array("i", row) for row in dependents]
+
+
+def _compute_execution_waves(
+    ids: Tuple[str, ...], deps: List["array[int]"], dependents: List["array[int]"]
+) -> Tuple[Tuple[str, ...], ...]:
+    # Kahn's algorithm, one frontier at a time: every agent in a wave has all of
+    # its dependencies in earlier waves, so a wave can run concurrently.
+    indegree = bytearray(len(row) for row in deps)
+    waves = []
+    placed = 0
+    wave = [i for i, n in enumerate(indegree) if n == 0]
+    while wave:
+        waves.append(tuple(ids[i] for i in wave))
+        placed += len(wave)
+        ready = []
+        for i in wave:
+            for child in dependents[i]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    ready.append(child)
+        wave = ready
+
+    if placed != len(ids):
+        stuck = sorted(ids[i] for i, n in enumerate(indegree) if n > 0)
+        raise ValueError(f"Circular agent dependencies among: {', '.join(stuck)}")
+    return tuple(waves)
+
+
+# The registry is fixed at import, so the dependency order, per-layer grouping
+# and output producers are computed once here rather than on every call.
+_EXECUTION_ORDER: Tuple[str, ...] = ()
+_AGENTS_BY_LAYER: Dict[int, Tuple[AgentDefinition, ...]] = {}
+_PRODUCER_OF: Dict[str, str] = {}
+
+
+def _compute_producers(by_layer: Dict[int, Tuple[AgentDefinition, ...]]) -> Dict[str, str]:
+    # A few names (e.g. "approved", "recommended_actions") are declared by more
+    # than one agent. The earliest layer wins, the same precedence
+    # Orchestrator.gather_inputs applies to overlapping output keys.
+    producers: Dict[str, str] = {}
+    for layer in sorted(by_layer):
+        for a in by_layer[layer]:
+            for name in a.outputs:
+                producers.setdefault(name, a.agent_id)
+    return producers
+
+
+def _warn_unreachable(ids: Tuple[str, ...], dependents: List["array[int]"], root: str = "orchestrator") -> None:
+    if root not in ids:
+        return
+    seen = {ids.index(root)}
+    stack = list(seen)
+    while stack:
+        for child in dependents[stack.pop()]:
+            if child not in seen:
+                seen.add(child)
+                stack.append(child)
+    unreachable = [agent_id for i, agent_id in enumerate(ids) if i not in seen]
+    if unreachable:
+        logger.warning("Agents not reachable from %s: %s", root, ", ".join(unreachable))
+
+
+def rebuild_registry_indexes() -> None:
+    """
+    Validate AGENT_REGISTRY and recompute the derived indexes.
+
+    Runs at import, so a malformed registry fails fast: unknown layers, unknown
+    dependency ids and cycles raise ValueError, agents unreachable from the
+    orchestrator are logged. Call again after mutating AGENT_REGISTRY.
+    """
+    global _EXECUTION_ORDER, _AGENTS_BY_LAYER, _PRODUCER_OF
+    ids, deps, dependents = _index_graph()
+    waves = _compute_execution_waves(ids, deps, dependents)
+    _warn_unreachable(ids, dependents)
+    # Waves are Kahn levels, so reading them in sequence is itself a valid
+    # topological order; no separate (recursive) sort is needed.
+    _EXECUTION_ORDER = tuple(agent_id for wave in waves for agent_id in wave)
+    _AGENTS_BY_LAYER = _compute_agents_by_layer()
+    _PRODUCER_OF = _compute_producers(_AGENTS_BY_LAYER)
+
+
+rebuild_registry_indexes()
+
+
 def get_agents_by_layer(layer: int) -> List[AgentDefinition]:
     """Get all agents for a specific layer."""
-    return [a for a in AGENT_REGISTRY.values() if a.layer == layer]
+    return list(_AGENTS_BY_LAYER.get(layer, ()))
 
 
 def get_agent_execution_order() -> List[str]:
     """Get agents in dependency-respecting execution order."""
-    order = []
-    visited = set()
-
-    def visit(agent_id: str):
-        if agent_id in visited:
-            return
-        agent = AGENT_REGISTRY.get(agent_id)
-        if agent:
-            for dep in agent.dependencies:
-                visit(dep)
-            visited.add(agent_id)
-            order.append(agent_id)
-
-    for agent_id in AGENT_REGISTRY:
-        visit(agent_id)
-
-    return order
+    return list(_EXECUTION_ORDER)
+
+
+def producer_of(name: str) -> Optional[str]:
+    """Get the id of the agent that declares `name` as an output, if any."""
+    return _PRODUCER_OF.get(name)
@@ -7,10 +7,16 @@ Tracks the complete state of a book project through all development layers.
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, List, Optional, Any
-import json
+from typing import Dict, List, Optional, Any, Sequence
 import uuid
 
+import orjson
+import zstandard as zstd
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
 
 class AgentStatus(Enum):
     """Status of an agent's execution."""
@@ -31,38 +37,46 @@ class LayerStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class GateResult:
     """Result of a quality gate check."""
     passed: bool
     message: str
     details: Dict[str, Any] = field(default_factory=dict)
-    timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    timestamp: str = field(default_factory=_now_iso)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentOutput:
     """Output from an agent's execution."""
     agent_id: str
     content: Dict[str, Any]
     gate_result: Optional[GateResult] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
-    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = field(default_factory=_now_iso)
     version: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     """State of a single agent."""
     agent_id: str
     name: str
     layer: int
     status: AgentStatus = AgentStatus.PENDING
-    outputs: List[AgentOutput] = field(default_factory=list)
+    # Most agents in a project never record an output (pending, skipped), so
+    # both start as the shared empty tuple; add_output() swaps in a list on
+    # first write. dependencies is the registry's own tuple and never mutated.
+    outputs: Sequence[AgentOutput] = ()
     current_output: Optional[AgentOutput] = None
     attempts: int = 0
     last_error: Optional[str] = None
-    dependencies: List[str] = field(default_factory=list)
+    dependencies: Sequence[str] = ()
+
+    def add_output(self, output: AgentOutput) -> None:
+        if not isinstance(self.outputs, list):
+            self.outputs = list(self.outputs)
+        self.outputs.append(output)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -78,7 +92,7 @@ class AgentState:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class LayerState:
     """State of a development layer."""
     layer_id: int
@@ -99,13 +113,13 @@ class LayerState:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BookProject:
     """Complete state of a book development project."""
     project_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     title: str = "Untitled Project"
-    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = field(default_factory=_now_iso)
 
     # User constraints and inputs
     user_constraints: Dict[str, Any] = field(default_factory=dict)
@@ -140,21 +154,35 @@ class BookProject:
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), indent=2)
+        # OPT_NON_STR_KEYS: layer ids are int keys, stringified as json.dumps did.
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
 
     def save_checkpoint(self, name: str) -> None:
-        """Save current state as a checkpoint."""
+        """
+        Save current state as a checkpoint.
+
+        The snapshot is kept as zstd-compressed JSON rather than a live dict, so
+        holding many checkpoints doesn't keep a full copy of every agent's
+        output per checkpoint. Use checkpoint_snapshot() to read one back.
+        """
         self.checkpoints.append({
             "name": name,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _now_iso(),
             "layer": self.current_layer,
             "agent": self.current_agent,
-            "state_snapshot": self.to_dict()
+            "state_snapshot": zstd.ZstdCompressor(level=3).compress(
+                orjson.dumps(self.to_dict(), option=orjson.OPT_NON_STR_KEYS)
+            ),
         })
 
+    def checkpoint_snapshot(self, index: int = -1) -> Dict[str, Any]:
+        """Decode the state snapshot stored with a checkpoint (latest by default)."""
+        blob = self.checkpoints[index]["state_snapshot"]
+        return orjson.loads(zstd.ZstdDecompressor().decompress(blob))
+
     def update_timestamp(self) -> None:
         """Update the last modified timestamp."""
-        self.updated_at = datetime.now(timezone.utc).isoformat()
+        self.updated_at = _now_iso()
 
 
 # Layer definitions
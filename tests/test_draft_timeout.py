@@ -7,6 +7,7 @@ Tests for:
 
 import asyncio
 import unittest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 
@@ -14,29 +15,31 @@ from unittest.mock import MagicMock, patch
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Fields every outline chapter shares. Draft generation only reads the
+# outline, so one scene dict can back every chapter.
+_SCENE_PROTO = {
+    "scene_number": 1,
+    "scene_question": "Q",
+    "characters": [],
+    "location": "L",
+    "conflict_type": "internal",
+    "outcome": "O",
+    "word_target": 100,
+}
+_CHAPTER_PROTO = {"act": 1, "pov": "Protagonist", "word_target": 100}
+
+
 def _make_outline(n: int):
     """Build a minimal chapter_outline list with n chapters."""
     return [
         {
+            **_CHAPTER_PROTO,
             "number": i,
             "title": f"Chapter {i}",
-            "act": 1,
             "chapter_goal": f"Goal {i}",
-            "pov": "Protagonist",
             "opening_hook": f"Hook {i}",
             "closing_hook": f"Close {i}",
-            "word_target": 100,
-            "scenes": [
-                {
-                    "scene_number": 1,
-                    "scene_question": "Q",
-                    "characters": [],
-                    "location": "L",
-                    "conflict_type": "internal",
-                    "outcome": "O",
-                    "word_target": 100,
-                }
-            ],
+            "scenes": [_SCENE_PROTO],
         }
         for i in range(1, n + 1)
     ]
@@ -71,7 +74,7 @@ class TestDraftGenerationTimeoutContinues(unittest.IsolatedAsyncioTestCase):
         async def fake_generate(prompt, **kwargs):
             prompt_str = str(prompt)
             if "Write Chapter 2:" in prompt_str:
-                raise asyncio.TimeoutError()
+                raise TimeoutError()
             if kwargs.get("response_format") == "json":
                 return {
                     "outline_adherence_score": 90,
@@ -83,12 +86,7 @@ class TestDraftGenerationTimeoutContinues(unittest.IsolatedAsyncioTestCase):
         llm = MagicMock()
         llm.generate = fake_generate
 
-        # Pass-through wait_for so TimeoutError from fake_generate propagates.
-        async def passthrough_wait_for(coro, timeout):
-            return await coro
-
-        with patch("agents.structural.asyncio.wait_for", new=passthrough_wait_for):
-            result = await execute_draft_generation(_make_context(llm))
+        result = await execute_draft_generation(_make_context(llm))
 
         chapters = result["chapters"]
         failed = result["failed_chapters"]
@@ -102,6 +100,54 @@ class TestDraftGenerationTimeoutContinues(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(failed[0]["chapter"], 2)
         self.assertIn("timeout", failed[0]["error"].lower())
 
+    async def test_slow_chapter_hits_real_timeout(self):
+        import agents.structural as structural
+
+        async def fake_generate(prompt, **kwargs):
+            if "Write Chapter 2:" in str(prompt):
+                await asyncio.sleep(1)
+            if kwargs.get("response_format") == "json":
+                return {"outline_adherence_score": 90, "scene_checks": [], "chapter_deviations": []}
+            return "Chapter text with several words"
+
+        llm = MagicMock()
+        llm.generate = fake_generate
+
+        with patch.object(structural, "_DRAFT_CHAPTER_TIMEOUT", 0.05):
+            result = await structural.execute_draft_generation(_make_context(llm))
+
+        self.assertEqual([c["number"] for c in result["chapters"]], [1, 3])
+        self.assertEqual([f["chapter"] for f in result["failed_chapters"]], [2])
+
+
+class TestDraftGenerationOverlapsChapterChecks(unittest.IsolatedAsyncioTestCase):
+    """Summary and adherence calls for a chapter run concurrently."""
+
+    async def test_summary_and_adherence_overlap(self):
+        from agents.structural import execute_draft_generation
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_generate(prompt, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if kwargs.get("response_format") == "json":
+                return {"outline_adherence_score": 90, "scene_checks": [], "chapter_deviations": []}
+            return "Chapter text with several words"
+
+        llm = MagicMock()
+        llm.generate = fake_generate
+
+        result = await execute_draft_generation(_make_context(llm))
+
+        self.assertEqual(peak, 2)
+        self.assertEqual([c["number"] for c in result["chapters"]], [1, 2, 3])
+        self.assertEqual(result["failed_chapters"], [])
+
 
 # ---------------------------------------------------------------------------
 # Test 2 – progress_callback called once per chapter with correct fields
@@ -130,11 +176,7 @@ class TestDraftGenerationProgressCallback(unittest.IsolatedAsyncioTestCase):
         async def cb(data: dict) -> None:
             received.append(dict(data))
 
-        async def passthrough_wait_for(coro, timeout):
-            return await coro
-
-        with patch("agents.structural.asyncio.wait_for", new=passthrough_wait_for):
-            result = await execute_draft_generation(_make_context(llm), progress_callback=cb)
+        result = await execute_draft_generation(_make_context(llm), progress_callback=cb)
 
         chapters_total = len(_make_outline(3))
         self.assertEqual(len(received), chapters_total, "callback must fire once per chapter")
@@ -179,11 +221,17 @@ class TestHeartbeatEmittedDuringLongAgent(unittest.IsolatedAsyncioTestCase):
         call_count = {"n": 0}
 
         class FakeAgentOutput:
-            gate_result = MagicMock(passed=True, message="ok")
+            gate_result = SimpleNamespace(passed=True, message="ok")
 
         class FakeOrchestrator:
+            def __init__(self):
+                self._projects = {}
+
             def get_project(self, pid):
-                return MagicMock(project_id=pid)
+                # One plain stub per id; _run_pipeline looks projects up every loop.
+                if pid not in self._projects:
+                    self._projects[pid] = SimpleNamespace(project_id=pid)
+                return self._projects[pid]
 
             def get_available_agents(self, project):
                 call_count["n"] += 1
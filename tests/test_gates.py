@@ -1,3 +1,4 @@
+import json
 import unittest
 
 from core.gates import validate_agent_output
@@ -59,6 +60,19 @@ class TestGates(unittest.TestCase):
         passed, _, _, _ = validate_agent_output(agent_id="human_editor_review", content=bad, expected_outputs=list(bad.keys()))
         self.assertFalse(passed)
 
+    def test_schema_error_loc_is_field_path(self):
+        bad = {
+            "approved": True,
+            "confidence": 500,
+            "editorial_letter": "Looks good to me overall.",
+            "required_changes": [],
+            "optional_suggestions": [],
+        }
+        passed, _, details, _ = validate_agent_output(agent_id="human_editor_review", content=bad, expected_outputs=list(bad.keys()))
+        self.assertFalse(passed)
+        self.assertEqual(details["schema"], "HumanEditorReviewOutput")
+        self.assertEqual(details["schema_errors"][0]["loc"], ["confidence"])
+
     def test_kdp_readiness_requires_kindle_ready(self):
         bad = {
             "kindle_ready": False,
@@ -237,6 +251,24 @@ class TestGates(unittest.TestCase):
         passed, _, _, _ = validate_agent_output(agent_id="chapter_blueprint", content=good, expected_outputs=list(good.keys()))
         self.assertTrue(passed)
 
+    def test_normalized_content_is_json_native(self):
+        good = {
+            "chapter_outline": [self._make_blueprint_chapter(n) for n in (1, 2, 3)],
+            "chapter_goals": {"1": "goal one", "2": "goal two", "3": "goal three"},
+            "scene_list": [],
+            "scene_questions": {},
+            "hooks": {"chapter_hooks": [], "scene_hooks": []},
+            "pov_assignments": {"1": "Protagonist", "2": "Protagonist", "3": "Protagonist"},
+        }
+        passed, _, _, normalized = validate_agent_output(agent_id="chapter_blueprint", content=good, expected_outputs=list(good.keys()))
+        self.assertTrue(passed)
+        # Tuple-typed schema fields come back as lists, and the whole payload
+        # survives a JSON round trip unchanged.
+        characters = normalized["chapter_outline"][0]["scenes"][0]["characters"]
+        self.assertIs(type(characters), list)
+        self.assertEqual(characters, ["Protagonist"])
+        self.assertEqual(json.loads(json.dumps(normalized)), normalized)
+
     # ------------------------------------------------------------------
     # draft_generation additional cases
     # ------------------------------------------------------------------
@@ -47,6 +47,17 @@ class TestJobs(unittest.TestCase):
         self.assertIn("blocked_reason", job2.progress)
         self.assertEqual(job2.progress["blocked_reason"]["blocked_candidates"][0]["agent_id"], "draft_generation")
 
+    def test_event_log_is_bounded(self):
+        from core.jobs import MAX_JOB_EVENTS, JobManager, JobRecord
+
+        jm = JobManager()
+        job = JobRecord(job_id="j3", project_id="p3")
+        for i in range(5 * MAX_JOB_EVENTS):
+            jm._append_event(job, "heartbeat", f"tick {i}")
+        self.assertLess(len(job.events), 2 * MAX_JOB_EVENTS)
+        self.assertEqual(job.events[-1]["message"], f"tick {5 * MAX_JOB_EVENTS - 1}")
+        self.assertEqual(len(job.to_dict()["events"]), MAX_JOB_EVENTS)
+
     def test_write_chapters_job_no_live_objects_in_record(self):
         """Job record created by create_write_chapters_job must be serializable (no live objects)."""
         import json
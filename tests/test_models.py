@@ -1,6 +1,12 @@
 import unittest
 
-from models.agents import AGENT_REGISTRY, get_agent_execution_order
+from models.agents import (
+    AGENT_REGISTRY,
+    get_agent_execution_order,
+    get_agents_by_layer,
+    producer_of,
+    rebuild_registry_indexes,
+)
 
 
 class TestAgentRegistry(unittest.TestCase):
@@ -33,7 +39,7 @@ class TestAgentRegistry(unittest.TestCase):
             if agent_def.layer == 0:
                 self.assertEqual(
                     agent_def.dependencies,
-                    [],
+                    (),
                     msg=f"Layer-0 agent '{agent_id}' must have no dependencies",
                 )
 
@@ -44,6 +50,106 @@ class TestAgentRegistry(unittest.TestCase):
                 msg=f"Agent '{agent_id}' has an empty outputs list",
             )
 
+    def test_agents_by_layer_matches_registry(self):
+        layers = {a.layer for a in AGENT_REGISTRY.values()}
+        for layer in layers:
+            expected = [a.agent_id for a in AGENT_REGISTRY.values() if a.layer == layer]
+            self.assertEqual([a.agent_id for a in get_agents_by_layer(layer)], expected)
+        self.assertEqual(get_agents_by_layer(999), [])
+
+    def test_rebuild_registry_indexes_picks_up_registry_changes(self):
+        from dataclasses import replace
+
+        extra = replace(AGENT_REGISTRY["orchestrator"], agent_id="test_extra", dependencies=("orchestrator",))
+        AGENT_REGISTRY["test_extra"] = extra
+        try:
+            rebuild_registry_indexes()
+            self.assertIn("test_extra", get_agent_execution_order())
+            self.assertIn(extra, get_agents_by_layer(extra.layer))
+        finally:
+            del AGENT_REGISTRY["test_extra"]
+            rebuild_registry_indexes()
+        self.assertNotIn("test_extra", get_agent_execution_order())
+
+    def test_rebuild_registry_indexes_rejects_unknown_dependency(self):
+        from dataclasses import replace
+
+        AGENT_REGISTRY["test_bad"] = replace(AGENT_REGISTRY["orchestrator"], agent_id="test_bad", dependencies=("nope",))
+        try:
+            with self.assertRaisesRegex(ValueError, "test_bad -> nope"):
+                rebuild_registry_indexes()
+        finally:
+            del AGENT_REGISTRY["test_bad"]
+            rebuild_registry_indexes()
+
+    def test_layer_name_comes_from_layers_table(self):
+        from models.state import LAYERS
+
+        for agent_def in AGENT_REGISTRY.values():
+            self.assertEqual(agent_def.layer_name, LAYERS[agent_def.layer])
+
+    def test_producer_of(self):
+        self.assertEqual(producer_of("chapter_outline"), "chapter_blueprint")
+        self.assertIsNone(producer_of("no_such_field"))
+        # Declared by both; the earlier layer wins.
+        self.assertEqual(producer_of("recommended_actions"), "production_readiness")
+
+    def test_rebuild_registry_indexes_rejects_unknown_layer(self):
+        from dataclasses import replace
+
+        AGENT_REGISTRY["test_bad"] = replace(AGENT_REGISTRY["orchestrator"], agent_id="test_bad", layer=99)
+        try:
+            with self.assertRaisesRegex(ValueError, r"test_bad \(layer 99\)"):
+                rebuild_registry_indexes()
+        finally:
+            del AGENT_REGISTRY["test_bad"]
+            rebuild_registry_indexes()
+
+    def test_rebuild_registry_indexes_rejects_cycles(self):
+        from dataclasses import replace
+
+        base = AGENT_REGISTRY["orchestrator"]
+        AGENT_REGISTRY["test_a"] = replace(base, agent_id="test_a", dependencies=("test_b",))
+        AGENT_REGISTRY["test_b"] = replace(base, agent_id="test_b", dependencies=("test_a",))
+        try:
+            with self.assertRaisesRegex(ValueError, "test_a, test_b"):
+                rebuild_registry_indexes()
+        finally:
+            del AGENT_REGISTRY["test_a"], AGENT_REGISTRY["test_b"]
+            rebuild_registry_indexes()
+
+
+class TestBookProject(unittest.TestCase):
+
+    def test_checkpoint_snapshot_roundtrip(self):
+        from models.state import BookProject
+
+        project = BookProject(title="Checkpointed", user_constraints={"genre": "Mystery"})
+        project.save_checkpoint("first")
+        project.title = "Renamed"
+        project.save_checkpoint("second")
+
+        self.assertIsInstance(project.checkpoints[0]["state_snapshot"], bytes)
+        self.assertEqual(project.checkpoint_snapshot(0)["title"], "Checkpointed")
+        self.assertEqual(project.checkpoint_snapshot()["title"], "Renamed")
+        self.assertEqual(project.checkpoint_snapshot()["user_constraints"], {"genre": "Mystery"})
+
+
+class TestAgentState(unittest.TestCase):
+
+    def test_add_output_promotes_shared_default(self):
+        from models.state import AgentOutput, AgentState
+
+        idle = AgentState(agent_id="a", name="A", layer=1)
+        state = AgentState(agent_id="b", name="B", layer=1)
+        self.assertEqual(state.outputs, ())
+
+        state.add_output(AgentOutput(agent_id="b", content={}))
+        state.add_output(AgentOutput(agent_id="b", content={}))
+        self.assertEqual(len(state.outputs), 2)
+        self.assertEqual(idle.outputs, ())
+        self.assertEqual(idle.to_dict()["outputs_count"], 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,6 +5,7 @@ Tests for:
 3. gather_inputs O(1) index optimization
 """
 
+import dataclasses
 import unittest
 
 from core.gates import validate_agent_output
@@ -186,14 +187,16 @@ class TestGatherInputsPerformance(unittest.TestCase):
             return  # skip if registry is empty
 
         # Override inputs to include our custom key to verify index lookup works
-        original_inputs = agent_def.inputs
-        agent_def.inputs = list(original_inputs) + ["some_custom_output_key"]
+        # (definitions are frozen, so swap in a modified copy).
+        AGENT_REGISTRY[test_agent_id] = dataclasses.replace(
+            agent_def, inputs=agent_def.inputs + ("some_custom_output_key",)
+        )
         try:
             inputs = orch.gather_inputs(project, test_agent_id)
             self.assertIn("some_custom_output_key", inputs)
             self.assertEqual(inputs["some_custom_output_key"], "custom_value")
         finally:
-            agent_def.inputs = original_inputs
+            AGENT_REGISTRY[test_agent_id] = agent_def
 
     def test_gather_inputs_includes_agent_id_inputs(self):
         """Regression: agent-id wiring (e.g. draft_generation → chapter_blueprint) still works."""
@@ -212,5 +215,32 @@ class TestGatherInputsPerformance(unittest.TestCase):
         self.assertIn("chapter_blueprint", inputs)
 
 
+    def test_declared_producer_beats_earlier_undeclared_emitter(self):
+        """A declared producer wins over an earlier-layer agent emitting the same key."""
+        orch = Orchestrator(llm_client=None)
+        project = orch.create_project("Precedence Test", {"genre": "Fiction"})
+
+        early = orch._find_agent_state(project, "market_intelligence")
+        early.current_output = AgentOutput(agent_id="market_intelligence", content={"primary_theme": "stray"})
+        producer = orch._find_agent_state(project, "thematic_architecture")
+        producer.current_output = AgentOutput(agent_id="thematic_architecture", content={"primary_theme": "declared"})
+
+        inputs = orch.gather_inputs(project, "story_question")
+        self.assertEqual(inputs["primary_theme"], "declared")
+
+    def test_resolved_inputs_skip_output_index(self):
+        """Inputs resolved without the all-outputs index never build it."""
+        orch = Orchestrator(llm_client=None)
+        project = orch.create_project("Index Test", {"genre": "Fiction", "comparable_titles": ["Dune"]})
+
+        def fail(_project):
+            raise AssertionError("output index built")
+
+        orch._build_output_index = fail
+        inputs = orch.gather_inputs(project, "market_intelligence")
+        self.assertEqual(inputs["genre"], "Fiction")
+        self.assertEqual(inputs["comparable_titles"], ["Dune"])
+
+
 if __name__ == "__main__":
     unittest.main()
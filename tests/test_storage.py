@@ -0,0 +1,117 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from core.storage import FileJobStore, FileProjectStore, SqliteProjectStore
+
+
+class TestFileProjectStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = FileProjectStore(base_dir=os.path.join(self._tmp.name, "projects"))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_save_and_load_roundtrip(self):
+        data = {"project_id": "p1", "title": "Café", "layers": {0: {"status": "available"}}}
+        self.store.save_raw("p1", data)
+        loaded = self.store.load_raw("p1")
+        self.assertEqual(loaded["title"], "Café")
+        # Non-string keys are stringified, as with stdlib json.
+        self.assertEqual(loaded["layers"], {"0": {"status": "available"}})
+
+    def test_load_sees_overwrites_and_returns_fresh_objects(self):
+        self.store.save_raw("p1", {"v": 1})
+        first = self.store.load_raw("p1")
+        first["v"] = 99  # callers mutate what they load
+        self.assertEqual(self.store.load_raw("p1"), {"v": 1})
+        self.store.save_raw("p1", {"v": 2})
+        self.assertEqual(self.store.load_raw("p1"), {"v": 2})
+
+    def test_project_files_are_compressed(self):
+        self.store.save_raw("p1", {"text": "word " * 1000})
+        path = self.store.project_path("p1")
+        self.assertTrue(path.endswith(".json.zst"))
+        self.assertLess(os.path.getsize(path), 1000)
+
+    def test_reads_and_migrates_legacy_json(self):
+        os.makedirs(self.store.base_dir, exist_ok=True)
+        legacy = self.store.legacy_project_path("old")
+        with open(legacy, "w", encoding="utf-8") as f:
+            f.write('{"title": "Old"}')
+        self.assertEqual(self.store.list_project_ids(), ["old"])
+        self.assertEqual(self.store.load_raw("old"), {"title": "Old"})
+        self.store.save_raw("old", {"title": "New"})
+        self.assertFalse(os.path.exists(legacy))
+        self.assertEqual(self.store.list_project_ids(), ["old"])
+        self.assertEqual(self.store.load_raw("old"), {"title": "New"})
+
+    def test_large_files_load_via_mmap(self):
+        with mock.patch("core.storage._MMAP_THRESHOLD", 1):
+            self.store.save_raw("big", {"text": "word " * 100})
+            self.assertEqual(self.store.load_raw("big"), {"text": "word " * 100})
+            legacy = self.store.legacy_project_path("legacy")
+            with open(legacy, "w", encoding="utf-8") as f:
+                f.write('{"title": "Old"}')
+            self.assertEqual(self.store.load_raw("legacy"), {"title": "Old"})
+
+    def test_load_all_skips_unreadable_files(self):
+        self.store.save_raw("a", {"x": 1})
+        self.store.save_raw("b", {"x": 2})
+        with open(self.store.project_path("bad"), "wb") as f:
+            f.write(b"not zstd")
+        self.assertEqual(self.store.load_all(), {"a": {"x": 1}, "b": {"x": 2}, "bad": None})
+
+    def test_load_missing_returns_none(self):
+        self.assertIsNone(self.store.load_raw("missing"))
+
+    def test_list_project_ids(self):
+        self.store.save_raw("a", {"x": 1})
+        self.store.save_raw("b", {"x": 2})
+        self.assertEqual(sorted(self.store.list_project_ids()), ["a", "b"])
+
+
+class TestSqliteProjectStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = SqliteProjectStore(db_path=os.path.join(self._tmp.name, "projects.sqlite3"))
+
+    def tearDown(self):
+        self.store._conn.close()
+        self._tmp.cleanup()
+
+    def test_save_load_and_replace(self):
+        self.assertIsNone(self.store.load_raw("p1"))
+        self.store.save_raw("p1", {"layers": {0: "x"}})
+        self.assertEqual(self.store.load_raw("p1"), {"layers": {"0": "x"}})
+        self.store.save_raw("p1", {"v": 2})
+        self.assertEqual(self.store.load_raw("p1"), {"v": 2})
+        self.assertEqual(self.store.list_project_ids(), ["p1"])
+
+    def test_imports_file_projects_on_miss(self):
+        files = FileProjectStore(base_dir=self._tmp.name)
+        files.save_raw("old", {"x": 1})
+        self.assertEqual(self.store.list_project_ids(), ["old"])
+        self.assertEqual(self.store.load_all(), {"old": {"x": 1}})
+        self.store.save_raw("old", {"x": 2})
+        self.assertEqual(self.store.load_raw("old"), {"x": 2})
+
+
+class TestFileJobStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = FileJobStore(base_dir=os.path.join(self._tmp.name, "jobs"))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_save_and_load_roundtrip(self):
+        self.store.save_raw("j1", {"job_id": "j1", "events": [{"kind": "started"}]})
+        self.assertEqual(self.store.load_raw("j1")["events"], [{"kind": "started"}])
+        self.assertEqual(self.store.list_ids(), ["j1"])
+
+
+if __name__ == "__main__":
+    unittest.main()